@@ -124,7 +124,7 @@ QLineEdit:focus, QSpinBox:focus {
     border: 2px solid rgba(0,212,170,0.5);
 }
 
-QTextEdit {
+QTextEdit, QPlainTextEdit {
     background: rgba(255,255,255,0.08);
     border: none;
     border-radius: 10px;
@@ -288,7 +288,7 @@ QLineEdit:focus, QSpinBox:focus {
     border: 2px solid rgba(0,212,170,0.5);
 }
 
-QTextEdit {
+QTextEdit, QPlainTextEdit {
     background: rgba(255,255,255,0.08);
     border: none;
     border-radius: 10px;
@@ -385,7 +385,7 @@ QTextEdit#tasksDisplay {
 /* ======================
    Enhanced Table Styling
    ====================== */
-QTableWidget {
+QTableView {
     background-color: rgba(30, 30, 40, 0.8);
     alternate-background-color: rgba(45, 45, 55, 0.8);
     color: #f0f0f0;
@@ -396,13 +396,13 @@ QTableWidget {
     border-radius: 8px;
 }
 
-QTableWidget::item {
+QTableView::item {
     padding: 8px;
     border: none;
     color: #f0f0f0;
 }
 
-QTableWidget::item:selected {
+QTableView::item:selected {
     background-color: rgba(100, 255, 160, 0.3);
     color: #ffffff;
 }
@@ -802,7 +802,7 @@ QListWidget::item:selected {
 }
 
 /* ── TextEdit ── */
-QTextEdit {
+QTextEdit, QPlainTextEdit {
     background: rgba(255,255,255,0.05);
     border: 1px solid rgba(255,255,255,0.1);
     border-radius: 6px;
@@ -812,13 +812,13 @@ QTextEdit {
 }
 
 /* ── Table ── */
-QTableWidget {
+QTableView {
     background: rgba(255,255,255,0.05);
     border: 1px solid rgba(255,255,255,0.1);
     color: white;
     font-size: 9pt;
 }
-QTableWidget::item {
+QTableView::item {
     padding: 6px;
 }
 QHeaderView::section {
@@ -954,4 +954,71 @@ QWidget#contentArea {
     background: transparent;
 }
 
+/* ======================
+   Master Connection Panel & Task Buttons
+   ====================== */
+QPushButton#connectSelectedBtn, QPushButton#connectAllBtn, QPushButton#connectBtn,
+QPushButton#refreshTasksBtn, QPushButton#clearTasksBtn {
+    color: white;
+    border: none;
+    border-radius: 6px;
+    padding: 8px 12px;
+    font-size: 9pt;
+    font-weight: 600;
+}
+QPushButton#refreshTasksBtn, QPushButton#clearTasksBtn {
+    padding: 6px 12px;
+}
+
+QPushButton#connectSelectedBtn {
+    background: rgba(0, 245, 160, 0.7);
+}
+QPushButton#connectSelectedBtn:hover {
+    background: rgba(0, 245, 160, 0.85);
+}
+QPushButton#connectSelectedBtn:pressed {
+    background: rgba(0, 245, 160, 0.6);
+}
+
+QPushButton#connectAllBtn, QPushButton#connectBtn, QPushButton#refreshTasksBtn {
+    background: rgba(102, 126, 234, 0.7);
+}
+QPushButton#connectAllBtn:hover, QPushButton#connectBtn:hover, QPushButton#refreshTasksBtn:hover {
+    background: rgba(102, 126, 234, 0.85);
+}
+QPushButton#connectAllBtn:pressed, QPushButton#connectBtn:pressed, QPushButton#refreshTasksBtn:pressed {
+    background: rgba(102, 126, 234, 0.6);
+}
+
+QPushButton#connectSelectedBtn:disabled, QPushButton#connectAllBtn:disabled {
+    background: rgba(100, 100, 100, 0.3);
+    color: rgba(255, 255, 255, 0.3);
+}
+
+QPushButton#clearTasksBtn {
+    background: rgba(255, 100, 100, 0.7);
+}
+QPushButton#clearTasksBtn:hover {
+    background: rgba(255, 120, 120, 0.85);
+}
+QPushButton#clearTasksBtn:pressed {
+    background: rgba(255, 100, 100, 0.6);
+}
+
+QLineEdit#addressInput {
+    background: rgba(25, 30, 40, 0.9);
+    color: #e6e6fa;
+    border: 2px solid rgba(102, 126, 234, 0.25);
+    border-radius: 6px;
+    padding: 6px 10px;
+    font-size: 9pt;
+}
+QLineEdit#addressInput:focus {
+    border: 2px solid rgba(102, 126, 234, 0.5);
+    background: rgba(25, 30, 40, 1);
+}
+QLineEdit#addressInput:hover {
+    border: 2px solid rgba(102, 126, 234, 0.35);
+}
+
 """
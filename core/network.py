@@ -2,10 +2,22 @@
 Network Protocol - Handles communication between Master and Worker PCs
 """
 import json
+import logging
+import re
 import socket
 import threading
 import time
-from typing import Dict, Any, Callable, Optional
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Any, Callable, Optional, Union
+
+try:
+    import orjson  # Optional: faster decoding of incoming messages
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
 
 class MessageType:
     # Master to Worker messages
@@ -25,6 +37,124 @@ class MessageType:
     # Discovery
     WORKER_DISCOVERY = "worker_discovery" 
 
+@dataclass
+class TaskPayload:
+    """Task request body sent from Master to Worker"""
+    __slots__ = ('task_id', 'code', 'data', 'name')
+    task_id: str
+    code: str
+    data: Dict[str, Any]
+    name: Optional[str]
+
+    def to_dict(self) -> Dict[str, Any]:
+        payload = {
+            'task_id': self.task_id,
+            'code': self.code,
+            'data': self.data
+        }
+        if self.name is not None:
+            payload['name'] = self.name
+        return payload
+
+@dataclass(frozen=True)
+class WorkerStats:
+    """Resource report body received from a Worker, stored as an immutable record"""
+    __slots__ = ('cpu_percent', 'memory_percent', 'memory_total_mb', 'memory_available_mb',
+                 'disk_percent', 'disk_free_gb', 'battery_percent', 'battery_plugged',
+                 'memory_total_gb', 'memory_used_gb', 'memory_available_gb')
+    cpu_percent: float
+    memory_percent: float
+    memory_total_mb: float
+    memory_available_mb: float
+    disk_percent: float
+    disk_free_gb: float
+    battery_percent: Optional[float]
+    battery_plugged: Optional[bool]
+    # Derived once per report for display
+    memory_total_gb: float
+    memory_used_gb: float
+    memory_available_gb: float
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'WorkerStats':
+        total_mb = data.get('memory_total_mb', 0.0)
+        available_mb = data.get('memory_available_mb', 0.0)
+        used_mb = total_mb - available_mb if total_mb > 0 else 0
+        return cls(
+            data.get('cpu_percent', 0.0),
+            data.get('memory_percent', 0.0),
+            total_mb,
+            available_mb,
+            data.get('disk_percent', 0.0),
+            data.get('disk_free_gb', 0.0),
+            data.get('battery_percent'),
+            data.get('battery_plugged'),
+            total_mb / 1024,
+            used_mb / 1024,
+            available_mb / 1024,
+        )
+
+def _encode_default(obj):
+    """json.dumps hook for payload objects that are not plain dicts"""
+    if isinstance(obj, TaskPayload):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+# orjson silently turns integers wider than 64 bits into floats, so leave such payloads to the stdlib
+_LONG_DIGITS = re.compile(r'\d{19}')
+_LONG_DIGITS_BYTES = re.compile(rb'\d{19}')
+
+def _loads(text: Union[str, bytes]):
+    """json.loads, using orjson when it is installed"""
+    if orjson is not None:
+        pattern = _LONG_DIGITS_BYTES if isinstance(text, bytes) else _LONG_DIGITS
+        if pattern.search(text) is None:
+            try:
+                return orjson.loads(text)
+            except orjson.JSONDecodeError:
+                pass  # e.g. NaN, which the stdlib decoder accepts
+    return json.loads(text)
+
+RECV_BUFFER_SIZE = 65536
+
+def _recv_lines(sock: socket.socket, keep_going: Callable[[], bool]):
+    """Yield each newline-terminated message received on sock (as bytes) until it closes"""
+    buffer = bytearray()
+    while keep_going():
+        chunk = sock.recv(RECV_BUFFER_SIZE)
+        if not chunk:
+            return
+        buffer += chunk
+        if b'\n' not in chunk:
+            continue  # Only a new chunk can complete a message; never rescan the pending partial line
+        end = buffer.rfind(b'\n')
+        complete = bytes(buffer[:end])
+        del buffer[:end + 1]
+        for line in complete.split(b'\n'):
+            line = line.strip()
+            if line:
+                yield line
+
+_HAS_SENDMSG = hasattr(socket.socket, 'sendmsg')  # Not available on Windows
+
+def _send_all(sock: socket.socket, data):
+    """Like sendall, but the socket timeout bounds each send() rather than the whole transfer"""
+    view = memoryview(data)
+    while view:
+        view = view[sock.send(view):]
+
+def _send_frame(sock: socket.socket, payload: bytes):
+    """Send payload plus the message terminator, gathered into one syscall where sendmsg exists"""
+    if not _HAS_SENDMSG:
+        _send_all(sock, payload + b'\n')
+        return
+    sent = sock.sendmsg([payload, b'\n'])
+    if sent < len(payload):
+        _send_all(sock, memoryview(payload)[sent:])  # Short write on a large payload; finish without copying
+        sent = len(payload)
+    if sent == len(payload):
+        _send_all(sock, b'\n')
+
 class NetworkMessage:
     def __init__(self, msg_type: str, data: Dict[str, Any] = None):
         self.type = msg_type
@@ -36,12 +166,12 @@ class NetworkMessage:
             'type': self.type,
             'data': self.data,
             'timestamp': self.timestamp
-        })
+        }, default=_encode_default)
     
     @classmethod
-    def from_json(cls, json_str: str):
+    def from_json(cls, json_str: Union[str, bytes]):
         try:
-            data = json.loads(json_str)
+            data = _loads(json_str)
             msg = cls(data['type'], data.get('data', {}))
             msg.timestamp = data.get('timestamp', time.time())
             return msg
@@ -49,22 +179,26 @@ class NetworkMessage:
             raise ValueError(f"Invalid message format: {e}")
 
 class MasterNetwork:
+    PROGRESS_COALESCE_INTERVAL = 0.1  # seconds; progress reports per task are merged within this window
+
     def __init__(self):
         self.workers: Dict[str, socket.socket] = {}
         self.worker_info: Dict[str, Dict] = {}
         self.discovered_workers: Dict[str, Dict] = {}  # Workers found via UDP broadcast
         self.message_handlers: Dict[str, Callable] = {}
         self.running = False
-        self.lock = threading.Lock()
+        self.lock = threading.Lock()  # guards the dicts only; never held across socket I/O
+        self._send_locks: Dict[str, threading.Lock] = {}  # worker id -> lock serializing frames on its socket
         self.discovery_socket: Optional[socket.socket] = None
         self.discovery_port = 5000  # Port for UDP discovery
+        self._pending_progress: Dict[str, tuple] = OrderedDict()  # task id -> (worker id, data)
+        self._progress_lock = threading.Lock()
+        self._progress_ready = threading.Condition(self._progress_lock)  # signals the progress flusher
+        self._progress_thread: Optional[threading.Thread] = None
+
     def broadcast_task(self, task_id: str, code: str, data: Dict[str, Any]):
         """Send the task to all connected workers"""
-        task_data = {
-            'task_id': task_id,
-            'code': code,
-            'data': data
-        }
+        task_data = TaskPayload(task_id, code, data, None)
         for worker_id in list(self.workers.keys()):
             self.send_task_to_worker(worker_id, task_data)
 
@@ -101,6 +235,7 @@ class MasterNetwork:
                 
                 with self.lock:
                     self.workers[worker_id] = sock
+                    self._send_locks[worker_id] = threading.Lock()
                     self.worker_info[worker_id] = {
                         'ip': ip,
                         'port': port,
@@ -181,100 +316,175 @@ class MasterNetwork:
     def disconnect_worker(self, worker_id: str):
         """Disconnect from a worker"""
         with self.lock:
-            if worker_id in self.workers:
-                try:
-                    # Send disconnect message
-                    msg = NetworkMessage(MessageType.DISCONNECT)
-                    self.workers[worker_id].send(msg.to_json().encode() + b'\n')
-                    self.workers[worker_id].close()
-                except:
-                    pass
-                
-                del self.workers[worker_id]
-                if worker_id in self.worker_info:
-                    self.worker_info[worker_id]['status'] = 'disconnected'
+            sock = self.workers.pop(worker_id, None)
+            send_lock = self._send_locks.pop(worker_id, None)
+            if sock is None:
+                return
+            if worker_id in self.worker_info:
+                self.worker_info[worker_id]['status'] = 'disconnected'
+
+        # The worker is already unlisted; say goodbye outside self.lock so a stalled peer blocks only this call
+        try:
+            with send_lock:
+                msg = NetworkMessage(MessageType.DISCONNECT)
+                _send_frame(sock, msg.to_json().encode())
+        except:
+            pass
+        try:
+            sock.close()
+        except:
+            pass
     
-    def send_task_to_worker(self, worker_id: str, task_data: Dict) -> bool:
+    def send_task_to_worker(self, worker_id: str, task_data: Union[TaskPayload, Dict]) -> bool:
         """Send a task to a specific worker"""
         msg = NetworkMessage(MessageType.TASK_REQUEST, task_data)
         return self._send_message_to_worker(worker_id, msg)
     
     def request_resources_from_worker(self, worker_id: str) -> bool:
         """Request system resource data from a worker"""
-        print(f"[NETWORK] Requesting resources from {worker_id}")
         msg = NetworkMessage(MessageType.RESOURCE_REQUEST, {})
         result = self._send_message_to_worker(worker_id, msg)
-        print(f"[NETWORK] Resource request sent to {worker_id}: {result}")
+        logger.debug("Resource request to %s sent: %s", worker_id, result)
         return result
-    
-    def _send_message_to_worker(self, worker_id: str, message: NetworkMessage) -> bool:
-        """Send a message to a worker"""
+
+    def request_resources_all(self, worker_ids) -> int:
+        """Request resource data from several workers with a single serialized frame"""
+        frame = NetworkMessage(MessageType.RESOURCE_REQUEST, {}).to_json().encode() + b'\n'
+        sent = 0
+        failed = []
+        # Copy the targets under self.lock, then send without it so one stalled worker delays nobody else
         with self.lock:
-            if worker_id not in self.workers:
-                return False
-            
+            targets = [(worker_id, self.workers[worker_id], self._send_locks[worker_id])
+                       for worker_id in worker_ids if worker_id in self.workers]
+
+        for worker_id, sock, send_lock in targets:
             try:
-                sock = self.workers[worker_id]
-                sock.send(message.to_json().encode() + b'\n')
-                return True
+                with send_lock:
+                    _send_all(sock, frame)
+                sent += 1
             except Exception as e:
                 print(f"Failed to send message to worker {worker_id}: {e}")
-                # Remove disconnected worker
-                self._remove_worker(worker_id)
-                return False
+                failed.append((worker_id, sock))
+
+        for worker_id, sock in failed:
+            self._remove_worker(worker_id, sock)
+        return sent
+
+    def _send_message_to_worker(self, worker_id: str, message: NetworkMessage) -> bool:
+        """Send a message to a worker"""
+        # Only look the socket up under self.lock; a slow send must not stall get_connected_workers()
+        with self.lock:
+            sock = self.workers.get(worker_id)
+            send_lock = self._send_locks.get(worker_id)
+        if sock is None:
+            return False
+
+        try:
+            with send_lock:
+                _send_frame(sock, message.to_json().encode())
+            return True
+        except Exception as e:
+            print(f"Failed to send message to worker {worker_id}: {e}")
+            # Remove disconnected worker
+            self._remove_worker(worker_id, sock)
+            return False
     
     def _listen_to_worker(self, worker_id: str, sock: socket.socket):
         """Listen for messages from a worker"""
-        buffer = ""
         try:
-            while self.running and worker_id in self.workers:
-                data = sock.recv(4096).decode()
-                if not data:
-                    break
-                
-                buffer += data
-                while '\n' in buffer:
-                    line, buffer = buffer.split('\n', 1)
-                    if line.strip():
-                        try:
-                            message = NetworkMessage.from_json(line.strip())
-                            self._handle_worker_message(worker_id, message)
-                        except Exception as e:
-                            print(f"Error processing message from {worker_id}: {e}")
+            for line in _recv_lines(sock, lambda: self.running and worker_id in self.workers):
+                try:
+                    message = NetworkMessage.from_json(line)
+                    self._handle_worker_message(worker_id, message)
+                except Exception as e:
+                    print(f"Error processing message from {worker_id}: {e}")
         
         except Exception as e:
             print(f"Connection lost with worker {worker_id}: {e}")
         finally:
-            self._remove_worker(worker_id)
+            self._remove_worker(worker_id, sock)
     
     def _handle_worker_message(self, worker_id: str, message: NetworkMessage):
         """Handle a message from a worker"""
-        print(f"[MASTER NETWORK] Received message from {worker_id}, type: {message.type}")
+        logger.debug("Received %s from %s", message.type, worker_id)
         
         # Update last heartbeat
         with self.lock:
             if worker_id in self.worker_info:
                 self.worker_info[worker_id]['last_heartbeat'] = time.time()
         
+        if message.type == MessageType.PROGRESS_UPDATE:
+            self._queue_progress(worker_id, message.data)
+            return
+
+        task_id = message.data.get('task_id') if isinstance(message.data, dict) else None
+        if task_id:
+            # A result/error supersedes any progress still waiting to be delivered
+            with self._progress_lock:
+                self._pending_progress.pop(task_id, None)
+
         # Call registered handler
         if message.type in self.message_handlers:
-            print(f"[MASTER NETWORK] Calling handler for {message.type}")
+            logger.debug("Calling handler for %s", message.type)
             self.message_handlers[message.type](worker_id, message.data)
         else:
             print(f"[MASTER NETWORK] No handler registered for {message.type}")
     
-    def _remove_worker(self, worker_id: str):
-        """Remove a worker from active connections"""
+    def _queue_progress(self, worker_id: str, data: Dict):
+        """Keep only the latest progress report per task and deliver it on the next flush"""
+        key = data.get('task_id') or worker_id
+        with self._progress_ready:
+            self._pending_progress[key] = (worker_id, data)
+            if self._progress_thread is None:
+                self._progress_thread = threading.Thread(target=self._progress_loop, daemon=True)
+                self._progress_thread.start()
+            self._progress_ready.notify()
+
+    def _progress_loop(self):
+        """Single long-lived flusher: wait for reports, let the window fill, then deliver"""
+        while True:
+            with self._progress_ready:
+                while self.running and not self._pending_progress:
+                    self._progress_ready.wait()
+                if not self.running:
+                    self._progress_thread = None
+                    return
+            time.sleep(self.PROGRESS_COALESCE_INTERVAL)
+            self._flush_progress()
+
+    def _flush_progress(self):
+        """Deliver coalesced progress reports in arrival order"""
+        with self._progress_lock:
+            pending = self._pending_progress
+            self._pending_progress = OrderedDict()
+
+        handler = self.message_handlers.get(MessageType.PROGRESS_UPDATE)
+        if not handler:
+            return
+        for worker_id, data in pending.values():
+            try:
+                handler(worker_id, data)
+            except Exception as e:
+                print(f"Error processing progress from {worker_id}: {e}")
+
+    def _remove_worker(self, worker_id: str, sock: Optional[socket.socket] = None):
+        """Remove a worker from active connections (only if still on sock, when given: it may have reconnected)"""
         with self.lock:
-            if worker_id in self.workers:
-                try:
-                    self.workers[worker_id].close()
-                except:
-                    pass
+            current = self.workers.get(worker_id)
+            if sock is not None and current is not sock:
+                return
+            if current is not None:
                 del self.workers[worker_id]
+                self._send_locks.pop(worker_id, None)
             
             if worker_id in self.worker_info:
                 self.worker_info[worker_id]['status'] = 'disconnected'
+
+        if current is not None:
+            try:
+                current.close()
+            except:
+                pass
     
     def get_connected_workers(self) -> Dict[str, Dict]:
         """Get information about connected workers"""
@@ -301,7 +511,7 @@ class MasterNetwork:
                 while self.running:
                     try:
                         data, addr = self.discovery_socket.recvfrom(1024)
-                        message = json.loads(data.decode())
+                        message = _loads(data)
                         
                         if message.get('type') == MessageType.WORKER_DISCOVERY:
                             worker_data = message.get('data', {})
@@ -342,6 +552,9 @@ class MasterNetwork:
     def stop(self):
         """Stop the network manager and disconnect all workers"""
         self.running = False
+        with self._progress_ready:
+            self._pending_progress.clear()
+            self._progress_ready.notify()  # Wake the flusher so it sees running is False and exits
         if self.discovery_socket:
             try:
                 self.discovery_socket.close()
@@ -364,6 +577,7 @@ class WorkerNetwork:
         self.port = 0
         self.hostname = socket.gethostname()
         self.discovery_port = 5000
+        self._send_lock = threading.Lock()
     
     def register_handler(self, message_type: str, handler: Callable):
         """Register a handler for a specific message type"""
@@ -508,7 +722,7 @@ class WorkerNetwork:
                         'worker_id': f"{self.ip}:{self.port}",
                         'capabilities': ['computation', 'data_analysis']
                     })
-                    self.client_socket.send(ready_msg.to_json().encode() + b'\n')
+                    _send_frame(self.client_socket, ready_msg.to_json().encode())
                     
                     # Start listening for messages
                     threading.Thread(target=self._listen_to_master, daemon=True).start()
@@ -527,22 +741,13 @@ class WorkerNetwork:
     
     def _listen_to_master(self):
         """Listen for messages from master"""
-        buffer = ""
         try:
-            while self.running and self.client_socket:
-                data = self.client_socket.recv(4096).decode()
-                if not data:
-                    break
-                
-                buffer += data
-                while '\n' in buffer:
-                    line, buffer = buffer.split('\n', 1)
-                    if line.strip():
-                        try:
-                            message = NetworkMessage.from_json(line.strip())
-                            self._handle_master_message(message)
-                        except Exception as e:
-                            print(f"Error processing message from master: {e}")
+            for line in _recv_lines(self.client_socket, lambda: self.running and self.client_socket):
+                try:
+                    message = NetworkMessage.from_json(line)
+                    self._handle_master_message(message)
+                except Exception as e:
+                    print(f"Error processing message from master: {e}")
         
         except Exception as e:
             print(f"Connection lost with master: {e}")
@@ -567,8 +772,9 @@ class WorkerNetwork:
             return False
         
         try:
-            json_data = message.to_json()
-            self.client_socket.send(json_data.encode() + b'\n')
+            payload = message.to_json().encode()
+            with self._send_lock:  # Results, progress and resource reports come from different threads
+                _send_frame(self.client_socket, payload)
             return True
         except Exception as e:
             return False
@@ -2,13 +2,44 @@
 Task Manager - Handles task distribution and execution
 """
 import json
+import math
 import time
+import bisect
 import uuid
 import threading
+from collections import Counter
 from enum import Enum
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 from typing import Dict, List, Any, Optional
 
+try:
+    import orjson  # Optional: much faster pretty-printing of large task results
+except ImportError:
+    orjson = None
+
+def _has_non_finite(obj) -> bool:
+    """Whether obj contains a NaN or infinite float anywhere (including dict keys)"""
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_has_non_finite(k) or _has_non_finite(v) for k, v in obj.items())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_non_finite(v) for v in obj)
+    return False
+
+def dumps_pretty(obj) -> str:
+    """Indented JSON text for display, using orjson when it is installed"""
+    if orjson is not None:
+        try:
+            text = orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass  # e.g. integers wider than 64 bits; the stdlib encoder handles them
+        else:
+            # orjson silently writes NaN/Infinity as null; only then is the (rare) scan worth it
+            if b"null" not in text or not _has_non_finite(obj):
+                return text.decode()
+    return json.dumps(obj, indent=2)
+
 class TaskType(Enum):
     CUSTOM = "custom"  # ✅ Add this line
     COMPUTATION = "computation"
@@ -38,10 +69,99 @@ class Task:
     completed_at: Optional[float] = None
     progress: int = 0
     output: Optional[str] = None  # Full output including stdout/stderr
+    # Display strings, built on first access and tagged with the _text_rev they were built from.
+    # The UI thread fills them while the network thread clears them, so a text formatted from
+    # data that changed mid-format carries a stale revision and is never served.
+    _text_rev: int = field(default=0, init=False, repr=False, compare=False)
+    _result_cache: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)  # (rev, text)
+    _output_cache: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)  # (rev, text, lines)
     
     def __post_init__(self):
         if self.created_at is None:
             self.created_at = time.time()
+
+    def clear_text_cache(self):
+        """Invalidate cached display strings; call after result/error/output change"""
+        self._text_rev += 1
+        self._result_cache = None
+        self._output_cache = None
+
+    def get_result_text(self) -> str:
+        """Short one-line summary of the result for table display"""
+        rev = self._text_rev  # Read before formatting: a clear during the format makes this entry stale
+        cached = self._result_cache
+        if cached is None or cached[0] != rev:
+            cached = (rev, self._format_result())
+            if self._text_rev == rev:  # Don't clobber an entry built from newer data
+                self._result_cache = cached
+        return cached[1]
+
+    def _get_output_entry(self) -> tuple:
+        rev = self._text_rev
+        cached = self._output_cache
+        if cached is None or cached[0] != rev:
+            text = self._format_output()
+            cached = (rev, text, text.count('\n') + 1)
+            if self._text_rev == rev:
+                self._output_cache = cached
+        return cached
+
+    def get_output_text(self) -> str:
+        """Full multi-line output for table display"""
+        return self._get_output_entry()[1]
+
+    def get_output_line_count(self) -> int:
+        """Number of lines in get_output_text(), counted once per cached text"""
+        return self._get_output_entry()[2]
+
+    def warm_text_cache(self):
+        """Build the display strings ahead of the first paint; safe off the UI thread (revision-tagged)"""
+        self.get_result_text()
+        self._get_output_entry()
+
+    def _format_result(self) -> str:
+        if self.result is not None:
+            if isinstance(self.result, dict):
+                result_parts = []
+                for key, val in list(self.result.items())[:3]:  # Show first 3 items
+                    if isinstance(val, (int, float)):
+                        result_parts.append(f"{key}: {val}")
+                    elif isinstance(val, str) and len(val) < 30:
+                        result_parts.append(f"{key}: {val}")
+                    else:
+                        result_parts.append(f"{key}: ...")
+                result_text = ", ".join(result_parts)
+                if len(self.result) > 3:
+                    result_text += f" (+{len(self.result)-3} more)"
+                return result_text
+            if isinstance(self.result, (list, tuple)):
+                if len(self.result) <= 3:
+                    return str(self.result)
+                return str(list(self.result)[:3]) + f" ... (+{len(self.result)-3} more)"
+            result_str = str(self.result)
+            return result_str[:100] + ("..." if len(result_str) > 100 else "")
+        if self.error:
+            return f"Error: {self.error[:80]}"
+        return "Pending..."
+
+    def _format_output(self) -> str:
+        if self.output:
+            return str(self.output)
+        if self.error:
+            return f"ERROR:\n{self.error}"
+        if self.result is not None:
+            if isinstance(self.result, dict):
+                output_lines = []
+                for key, val in self.result.items():
+                    if isinstance(val, (dict, list)):
+                        output_lines.append(f"{key}: {dumps_pretty(val)}")
+                    else:
+                        output_lines.append(f"{key}: {val}")
+                return "\n".join(output_lines)
+            if isinstance(self.result, (list, tuple)):
+                return dumps_pretty(list(self.result) if isinstance(self.result, tuple) else self.result)
+            return str(self.result)
+        return "No output yet"
     
     def to_dict(self):
         return {
@@ -76,11 +196,15 @@ class Task:
         )
         return task
 
+_ACTIVE_STATUSES = frozenset({TaskStatus.PENDING, TaskStatus.RUNNING})
+
 class TaskManager:
     def __init__(self):
         self.tasks: Dict[str, Task] = {}
         self.task_queue: List[str] = []
+        self._sorted_keys: List[tuple] = []  # (-created_at, task_id), newest first
         self.lock = threading.Lock()
+        self.version = 0  # Bumped under the lock whenever a task is added, removed or changed
     
     # ── Task lifecycle helpers ──
     
@@ -97,6 +221,8 @@ class TaskManager:
         with self.lock:
             self.tasks[task_id] = task
             self.task_queue.append(task_id)
+            bisect.insort(self._sorted_keys, (-task.created_at, task_id))
+            self.version += 1
         
         return task_id
     
@@ -108,6 +234,7 @@ class TaskManager:
                 if task.status == TaskStatus.PENDING:
                     task.status = TaskStatus.RUNNING
                     task.started_at = time.time()
+                    self.version += 1
                     return task
         return None
     
@@ -123,6 +250,8 @@ class TaskManager:
                 else:
                     task.status = TaskStatus.COMPLETED
                     task.result = result
+                task.clear_text_cache()
+                self.version += 1
     
     def assign_task_to_worker(self, task_id: str, worker_id: str):
         """Assign a task to a specific worker"""
@@ -132,6 +261,17 @@ class TaskManager:
                 if self.tasks[task_id].status == TaskStatus.PENDING:
                     self.tasks[task_id].status = TaskStatus.RUNNING
                     self.tasks[task_id].started_at = time.time()
+                self.version += 1
+
+    def unassign_task(self, task_id: str, worker_id: str):
+        """Return a task to pending after its send to worker_id failed (no-op if it has moved on)"""
+        with self.lock:
+            task = self.tasks.get(task_id)
+            if task and task.worker_id == worker_id and task.status == TaskStatus.RUNNING:
+                task.worker_id = None
+                task.status = TaskStatus.PENDING
+                task.started_at = None
+                self.version += 1
     
     def update_task(self, task_id: str, worker_id: str, result_payload: Dict[str, Any]):
         """Update a task with result information from a worker"""
@@ -157,21 +297,27 @@ class TaskManager:
             if result_payload.get('result') is not None:
                 result_val = result_payload.get('result')
                 if isinstance(result_val, dict):
-                    output_parts.append(f"RESULT:\n{json.dumps(result_val, indent=2)}")
+                    output_parts.append(f"RESULT:\n{dumps_pretty(result_val)}")
                 else:
                     output_parts.append(f"RESULT:\n{result_val}")
             if result_payload.get('error'):
                 output_parts.append(f"ERROR:\n{result_payload['error']}")
             
             task.output = "\n\n".join(output_parts) if output_parts else None
+            task.clear_text_cache()
+            self.version += 1
     
-    def update_task_progress(self, task_id: str, progress: int):
-        """Update progress for a specific task"""
+    def update_task_progress(self, task_id: str, progress: int) -> bool:
+        """Update progress for a specific task; returns whether the stored value changed"""
+        progress = max(0, min(100, int(progress)))
         with self.lock:
             task = self.tasks.get(task_id)
-            if not task:
-                return
-            task.progress = max(0, min(100, int(progress)))
+            # Late reports (delivered after the result) must not rewind a finished task
+            if not task or task.status not in _ACTIVE_STATUSES or task.progress == progress:
+                return False
+            task.progress = progress
+            self.version += 1
+            return True
     
     def get_task(self, task_id: str) -> Optional[Task]:
         """Get a task by its ID"""
@@ -181,6 +327,16 @@ class TaskManager:
         """Get all tasks"""
         return list(self.tasks.values())
     
+    def get_sorted_tasks(self) -> List[Task]:
+        """Get all tasks ordered newest first (order is maintained on create/clear)"""
+        tasks = self.tasks
+        return [tasks[task_id] for _, task_id in self._sorted_keys if task_id in tasks]
+
+    def get_active_task_counts(self) -> Dict[str, int]:
+        """Number of pending or running tasks assigned to each worker, counted in one pass"""
+        return Counter(task.worker_id for task in self.tasks.values()
+                       if task.worker_id and task.status in _ACTIVE_STATUSES)
+
     def get_tasks_by_status(self, status: TaskStatus) -> List[Task]:
         """Get tasks by their status"""
         return [task for task in self.tasks.values() if task.status == status]
@@ -191,6 +347,8 @@ class TaskManager:
             if status is None:
                 self.tasks.clear()
                 self.task_queue.clear()
+                self._sorted_keys.clear()
+                self.version += 1
                 return
             
             to_remove = [task_id for task_id, task in self.tasks.items() if task.status == status]
@@ -198,6 +356,10 @@ class TaskManager:
                 self.tasks.pop(task_id, None)
                 if task_id in self.task_queue:
                     self.task_queue.remove(task_id)
+            if to_remove:
+                removed = set(to_remove)
+                self._sorted_keys = [key for key in self._sorted_keys if key[1] not in removed]
+                self.version += 1
 
 # Predefined task templates
 TASK_TEMPLATES = {
@@ -526,3 +688,9 @@ result = generate_histogram(data['pixels'])
         }
     }
 }
+
+# Template keys grouped by task type, in TASK_TEMPLATES order
+TEMPLATES_BY_TYPE: Dict[TaskType, List[str]] = {}
+for _key, _template in TASK_TEMPLATES.items():
+    TEMPLATES_BY_TYPE.setdefault(_template.get("type"), []).append(_key)
+del _key, _template
@@ -1,24 +1,433 @@
-import sys, os, json, threading, time
+import sys, os, json, threading, time, logging, random
+from contextlib import contextmanager
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Optional
 from PyQt5 import QtWidgets, QtGui, QtCore
-from PyQt5.QtWidgets import QHeaderView, QSplitter, QPushButton, QComboBox, QListWidget
-from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtWidgets import QHeaderView, QSplitter, QComboBox
+from PyQt5.QtCore import Qt, QTimer, QObject, QRunnable, QThreadPool, pyqtSignal
 from PyQt5.QtGui import QIcon
 
 sys.path.append(os.path.abspath(os.path.join(__file__, "..", "..")))
 
 from assets.styles import STYLE_SHEET
-from core.task_manager import TaskManager, TASK_TEMPLATES, TaskStatus, TaskType
-from core.network import MasterNetwork, MessageType
+from core.task_manager import TaskManager, TASK_TEMPLATES, TEMPLATES_BY_TYPE, TaskStatus, TaskType, dumps_pretty
+from core.network import MasterNetwork, MessageType, TaskPayload, WorkerStats
+
+logger = logging.getLogger(__name__)
+
+# Item data role holding the worker id of a discovered_combo or workers_list row
+_WORKER_ID_ROLE = Qt.UserRole + 1
+
+# Status cell backgrounds, shared by every row
+_STATUS_BRUSHES = {
+    TaskStatus.COMPLETED: QtGui.QBrush(QtGui.QColor(200, 255, 200)),
+    TaskStatus.RUNNING: QtGui.QBrush(QtGui.QColor(255, 250, 200)),
+    TaskStatus.FAILED: QtGui.QBrush(QtGui.QColor(255, 200, 200)),
+}
+_DEFAULT_STATUS_BRUSH = QtGui.QBrush(QtGui.QColor(230, 230, 250))
+
+
+def _make_font(point_size: int, bold: bool = False, family: Optional[str] = None) -> QtGui.QFont:
+    """Font with only the given attributes set; the rest resolve against the widget's parent"""
+    font = QtGui.QFont(family) if family else QtGui.QFont()
+    font.setPointSize(point_size)
+    if bold:
+        font.setBold(True)
+    return font
+
+
+# Fonts shared by every widget that uses them
+_HEADER_FONT = _make_font(13, bold=True)
+_SMALL_BOLD_FONT = _make_font(9, bold=True)
+_MONO_FONT = _make_font(9, family="Consolas")
+
+_LOAD_ICONS = ("🟢", "🟡", "🔴")
+
+
+def _load_icon(percent: float) -> str:
+    """Traffic-light icon for a usage percentage: <50 green, <75 yellow, otherwise red"""
+    return _LOAD_ICONS[(percent >= 50) + (percent >= 75)]
+
+
+@lru_cache(maxsize=None)
+def _template_data_text(name: str) -> str:
+    """Pretty-printed sample data of a built-in template; templates never change, so each is formatted once"""
+    sample_data = TASK_TEMPLATES.get(name, {}).get("sample_data")
+    return dumps_pretty(sample_data) if sample_data is not None else "{}"
+
+
+# One worker's section of the resource display; positional %-formatting is the cheapest for a fixed layout
+_WORKER_BLOCK_FMT = (
+    "🖥️  WORKER: %s\n"
+    "%s\n"
+    "%s CPU Usage:          %5.1f%%\n"
+    "%s Memory Usage:       %5.1f%%\n"
+    "   • Total RAM:        %6.2f GB\n"
+    "   • Used RAM:         %6.2f GB\n"
+    "   💚 UNUTILIZED RAM:  %6.2f GB ⭐\n"
+    "%s Disk Usage:         %5.1f%%\n"
+    "   • Free Space:       %6.1f GB\n"
+    "%s\n"
+)
+
+# Widget stylesheets, parsed once and shared by every instance
+_EDITOR_QSS = """
+QPlainTextEdit {
+    background-color: rgba(30, 30, 40, 0.9);
+    color: #f0f0f0;
+    border: 2px solid rgba(100, 255, 160, 0.3);
+    border-radius: 6px;
+    padding: 8px;
+    font-size: 9pt;
+    font-family: 'Consolas';
+    line-height: 1.3;
+}
+QPlainTextEdit:focus {
+    border: 2px solid rgba(100, 255, 160, 0.6);
+}
+"""
+_RESOURCE_DISPLAY_QSS = """
+QPlainTextEdit {
+    background-color: rgba(30, 30, 40, 0.8);
+    color: #f0f0f0;
+    border: 1px solid rgba(100, 255, 160, 0.5);
+    border-radius: 8px;
+    padding: 10px;
+    font-size: 9pt;
+}
+"""
+
+_DISCOVERY_LABEL_QSS = "font-size: 9pt; font-weight: 600; color: #00f5a0; margin-bottom: 3px;"
+_HELP_TEXT_QSS = "font-size: 8pt; color: rgba(255, 255, 255, 0.5); margin-bottom: 5px;"
+_DISCOVERED_LIST_QSS = """
+QListView::item {
+    padding: 8px;
+    border-bottom: 1px solid rgba(255, 255, 255, 0.1);
+}
+QListView::item:hover {
+    background: rgba(0, 245, 160, 0.15);
+}
+"""
+_DISCOVERED_COMBO_QSS = """
+QComboBox {
+    background: rgba(15, 20, 30, 0.95);
+    color: #e6e6fa;
+    border: 2px solid rgba(0, 245, 160, 0.25);
+    border-radius: 6px;
+    padding: 6px 10px;
+    font-size: 9pt;
+}
+QComboBox:hover {
+    border: 2px solid rgba(0, 245, 160, 0.4);
+}
+QComboBox::drop-down {
+    border: none;
+    width: 30px;
+}
+QComboBox::down-arrow {
+    image: none;
+    border-left: 5px solid transparent;
+    border-right: 5px solid transparent;
+    border-top: 6px solid #00f5a0;
+    margin-right: 8px;
+}
+QComboBox QAbstractItemView {
+    background: rgba(20, 25, 35, 0.98);
+    color: #e6e6fa;
+    selection-background-color: rgba(0, 245, 160, 0.25);
+    border: 2px solid rgba(0, 245, 160, 0.4);
+    border-radius: 6px;
+    padding: 4px;
+}
+QComboBox QAbstractItemView::item {
+    padding: 8px 10px;
+    border-radius: 4px;
+    margin: 1px 2px;
+}
+QComboBox QAbstractItemView::item:hover {
+    background: rgba(0, 245, 160, 0.15);
+}
+"""
+_SEPARATOR_QSS = "background: rgba(255, 255, 255, 0.15); margin: 12px 0px 10px 0px; max-height: 1px;"
+_MANUAL_LABEL_QSS = "font-size: 9pt; font-weight: 600; color: #667eea; margin-bottom: 5px;"
+_TASK_DESCRIPTION_QSS = """
+QLabel {
+    color: #c1d5e0;
+    background-color: rgba(50, 50, 70, 0.5);
+    border-radius: 4px;
+    padding: 6px;
+    margin: 4px 0;
+}
+"""
+_TASKS_TABLE_QSS = """
+QTableView {
+    background: rgba(15, 20, 30, 0.95);
+    color: #e6e6fa;
+    border: 2px solid rgba(100, 255, 160, 0.25);
+    border-radius: 6px;
+    gridline-color: rgba(255, 255, 255, 0.08);
+    font-size: 9pt;
+}
+QTableView::item {
+    padding: 6px;
+    border: none;
+}
+QTableView::item:selected {
+    background: rgba(0, 245, 160, 0.2);
+    color: white;
+}
+QTableView::item:hover {
+    background: rgba(0, 245, 160, 0.1);
+}
+QHeaderView::section {
+    background: rgba(30, 35, 45, 0.95);
+    color: #00f5a0;
+    padding: 8px;
+    border: none;
+    border-bottom: 2px solid rgba(0, 245, 160, 0.3);
+    font-weight: bold;
+    font-size: 9pt;
+}
+QHeaderView::section:hover {
+    background: rgba(40, 45, 55, 0.95);
+}
+"""
+
+
+class ConnectSignals(QObject):
+    """Signals for reporting background connection attempts back to the UI thread"""
+    finished = pyqtSignal(str, bool)  # worker_id, connected
+
+
+class ConnectRunnable(QRunnable):
+    """Runs MasterNetwork.connect_to_worker (with its retries) on a thread pool"""
+
+    def __init__(self, network, signals: ConnectSignals, worker_id: str, ip: str, port: int):
+        super().__init__()
+        self.network = network
+        self.signals = signals
+        self.worker_id = worker_id
+        self.ip = ip
+        self.port = port
+
+    def run(self):
+        try:
+            connected = self.network.connect_to_worker(self.worker_id, self.ip, self.port)
+        except Exception as e:
+            print(f"[MASTER] ❌ Connection to {self.worker_id} raised: {e}")
+            connected = False
+        self.signals.finished.emit(self.worker_id, connected)
+
+
+
+class DispatchSignals(QObject):
+    """Signals for reporting background task sends back to the UI thread"""
+    finished = pyqtSignal(str, str, bool)  # task_id, worker_id, sent
+
+
+class DispatchRunnable(QRunnable):
+    """Serializes and sends one task with MasterNetwork.send_task_to_worker on the global thread pool"""
+
+    def __init__(self, network, signals: DispatchSignals, task_id: str, worker_id: str, payload: TaskPayload):
+        super().__init__()
+        self.network = network
+        self.signals = signals
+        self.task_id = task_id
+        self.worker_id = worker_id
+        self.payload = payload
+
+    def run(self):
+        try:
+            sent = self.network.send_task_to_worker(self.worker_id, self.payload)
+        except Exception as e:
+            print(f"[MASTER] ❌ Sending task {self.task_id[:8]}... raised: {e}")
+            sent = False
+        self.signals.finished.emit(self.task_id, self.worker_id, sent)
+
+
+class NetworkCallRunnable(QRunnable):
+    """Runs one blocking MasterNetwork call on the global thread pool"""
+
+    def __init__(self, fn, *args):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+
+    def run(self):
+        try:
+            self.fn(*self.args)
+        except Exception as e:
+            print(f"[MASTER] ❌ Background network call failed: {e}")
+
+class ProgressDelegate(QtWidgets.QStyledItemDelegate):
+    """Paints a progress bar from the cell's UserRole value instead of hosting a QProgressBar per row"""
+
+    def paint(self, painter, option, index):
+        value = index.data(QtCore.Qt.UserRole)
+        if value is None:
+            super().paint(painter, option, index)
+            return
+
+        opt = QtWidgets.QStyleOptionProgressBar()
+        opt.rect = option.rect.adjusted(4, 4, -4, -4)
+        opt.minimum = 0
+        opt.maximum = 100
+        opt.progress = value
+        opt.text = f"{value}%"
+        opt.textVisible = True
+        opt.textAlignment = QtCore.Qt.AlignCenter
+        opt.state = option.state | QtWidgets.QStyle.State_Horizontal
+
+        style = option.widget.style() if option.widget is not None else QtWidgets.QApplication.style()
+        style.drawControl(QtWidgets.QStyle.CE_ProgressBar, opt, painter, option.widget)
+
+
+class TaskTableModel(QtCore.QAbstractTableModel):
+    """Task queue model; cell text is produced on demand for the rows the view paints"""
+
+    HEADERS = ["ID", "Type", "Status", "Worker", "Progress", "Result", "Output"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._tasks = []
+        self._signatures = []
+
+    @staticmethod
+    def _signature(t) -> tuple:
+        return (t.status, t.progress, t.worker_id, id(t.result), t.error, t.output)
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self._tasks)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if orientation == QtCore.Qt.Horizontal and role == QtCore.Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        t = self._tasks[index.row()]
+        col = index.column()
+
+        if role == QtCore.Qt.DisplayRole:
+            if col == 0:
+                return t.id[:8]
+            if col == 1:
+                return t.type.name
+            if col == 2:
+                return t.status.name
+            if col == 3:
+                if not t.worker_id:
+                    return ""
+                return t.worker_id.split(":")[0] if ":" in t.worker_id else t.worker_id
+            if col == 5:
+                return t.get_result_text()
+            if col == 6:
+                return t.get_output_text()
+            return None
+        if role == QtCore.Qt.UserRole and col == 4:
+            try:
+                prog_val = int(getattr(t, 'progress', 0) or 0)
+            except Exception:
+                prog_val = 0
+            return max(0, min(100, prog_val))  # Painted by ProgressDelegate
+        if role == QtCore.Qt.ToolTipRole:
+            # Show full text on hover
+            if col == 5:
+                return t.get_result_text()
+            if col == 6:
+                return t.get_output_text()
+            return None
+        if role == QtCore.Qt.BackgroundRole and col == 2:
+            return _STATUS_BRUSHES.get(t.status, _DEFAULT_STATUS_BRUSH)
+        if role == QtCore.Qt.TextAlignmentRole and col == 6:
+            return int(QtCore.Qt.AlignLeft | QtCore.Qt.AlignTop)
+        return None
+
+    def task_at(self, row: int):
+        return self._tasks[row]
+
+    def set_tasks(self, tasks: list):
+        """Adopt a new task list and return the rows whose contents changed"""
+        signatures = [self._signature(t) for t in tasks]
+        old_ids = [t.id for t in self._tasks]
+        new_ids = [t.id for t in tasks]
+
+        if new_ids == old_ids:
+            changed = [row for row, sig in enumerate(signatures) if sig != self._signatures[row]]
+            self._tasks = tasks
+            self._signatures = signatures
+            for row in changed:
+                self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.HEADERS) - 1))
+            return changed
+
+        added = len(new_ids) - len(old_ids)
+        if added > 0 and new_ids[added:] == old_ids:
+            # Newest-first ordering: new tasks only ever appear at the top
+            self.beginInsertRows(QtCore.QModelIndex(), 0, added - 1)
+            old_signatures = self._signatures
+            self._tasks = tasks
+            self._signatures = signatures
+            self.endInsertRows()
+            changed = list(range(added))
+            for row in range(added, len(tasks)):
+                if signatures[row] != old_signatures[row - added]:
+                    self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.HEADERS) - 1))
+                    changed.append(row)
+            return changed
+
+        self.beginResetModel()
+        self._tasks = tasks
+        self._signatures = signatures
+        self.endResetModel()
+        return list(range(len(tasks)))
+
+
+def _score_resources(stats: dict) -> tuple:
+    """Resource part of a worker's load-balancing score: (score, cpu_available, mem_available, disk_free)"""
+    cpu_available = 100 - stats.get('cpu_percent', 100)  # Available CPU %
+    mem_available = stats.get('memory_available_mb', 0) or 0  # Available memory MB
+    disk_free = stats.get('disk_free_gb', 0) or 0  # Free disk GB
+
+    cpu_score = cpu_available * 0.3
+    mem_score = min(mem_available / 1024, 100) * 0.4  # Normalize to 0-100 scale
+    disk_score = min(disk_free * 10, 100) * 0.1  # Normalize to 0-100 scale
+    return cpu_score + mem_score + disk_score, cpu_available, mem_available, disk_free
+
+_NO_RESOURCES_SCORE = _score_resources({})
 
 class MasterUI(QtWidgets.QWidget):
+    # Emitted from network threads; connected with QueuedConnection so the slots run on the UI thread
+    resources_updated = pyqtSignal()
+    workers_changed = pyqtSignal()
+    task_refresh_requested = pyqtSignal()
+    worker_error_reported = pyqtSignal(str, str)  # worker_id, error
+
+    # Separator lines of the resource display
+    _SEP_EQ = "=" * 50
+    _SEP_DASH = "-" * 50
+
+    # Resource polling cadence: focused window / unfocused, minimized or hidden. The polls are the only
+    # traffic on an idle connection, so both must stay below the 30 s socket timeouts on either end.
+    MONITOR_ACTIVE_INTERVAL_MS = 10000
+    MONITOR_BACKGROUND_INTERVAL_MS = 20000
+
+    # From this many workers on, dispatch compares two randomly sampled workers instead of ranking them all
+    P2C_MIN_WORKERS = 16
+    # Below that, pick from the ranking with a folded normal so bursts spread over near-best workers
+    FAIR_DISPATCH = True
+
     def __init__(self):
         super().__init__()
         self.setObjectName("mainWindow")
         self.setWindowTitle("WinLink – Master PC")
 
         self.setWindowFlags(Qt.Window | Qt.CustomizeWindowHint | Qt.WindowMinMaxButtonsHint | Qt.WindowCloseButtonHint)
-        self.setAttribute(Qt.WA_TranslucentBackground, False)
         
         ROOT = os.path.abspath(os.path.join(__file__, "..", ".."))
         icon_path = os.path.join(ROOT, "assets", "WinLink_logo.ico")
@@ -29,9 +438,35 @@ class MasterUI(QtWidgets.QWidget):
 
         self.task_manager = TaskManager()
         self.network = MasterNetwork()
-        self.worker_resources = {}
-        self.worker_resources_lock = threading.Lock()
-        self.monitoring_active = True
+        # Read-only mapping republished on every write; readers use it without locking
+        self.worker_resources = MappingProxyType({})
+        self.worker_resources_lock = threading.Lock()  # serializes writers only
+        self._worker_scores = {}  # worker id -> _score_resources() of its latest report
+        self._task_refresh_dirty = False  # a refresh was skipped while the window was hidden
+        self._resource_refresh_dirty = False  # likewise for the resource display
+        self._resource_blocks = {}  # worker id -> (WorkerStats, formatted block)
+        self._resource_text = None  # text currently shown in resource_display
+        self._resource_segments = None  # segments behind _resource_text, when it was built from them
+        self._rendered_resources = None  # worker_resources mapping last drawn by update_resource_display
+        self._discovered_rows = {}  # worker id -> its QStandardItem in discovered_combo
+        self._discovered_sigs = {}  # worker id -> (hostname, ip, port, connected) last shown
+        self._rendered_task_version = None  # task_manager.version last drawn by refresh_task_table
+        self._worker_entries = []  # (worker id, "ip:port") rows currently in workers_list
+        self._refreshing_discovered = False
+        self._checked_ids = set()  # worker ids checked in discovered_combo, kept in sync by itemChanged
+        self._clock_second = None  # second last formatted by _clock_text
+        self._clock_str = ""
+        self._connecting = set()  # worker ids with a connection attempt in flight
+        self.connect_signals = ConnectSignals()
+        self.connect_signals.finished.connect(self._on_worker_connect_finished)
+        self._batch_connect = None  # progress of the running connect_from_list/connect_all_discovered batch
+        self.batch_connect_signals = ConnectSignals()
+        self.batch_connect_signals.finished.connect(self._on_batch_connect_finished)
+        self.dispatch_signals = DispatchSignals()
+        self.dispatch_signals.finished.connect(self._on_task_dispatched)
+        # Connects are I/O bound, so allow more of them in flight than the CPU-sized global pool
+        self.connect_pool = QThreadPool(self)
+        self.connect_pool.setMaxThreadCount(16)
 
         self.network.register_handler(MessageType.PROGRESS_UPDATE, self.handle_progress_update)
         self.network.register_handler(MessageType.TASK_RESULT, self.handle_task_result)
@@ -41,7 +476,51 @@ class MasterUI(QtWidgets.QWidget):
         self.network.start()
 
         self.setup_ui()
-        self.start_monitoring_thread()
+
+        self._last_resource_poll = 0.0  # time.monotonic() of the last periodic poll
+        self._monitor_interval_ms = self.MONITOR_ACTIVE_INTERVAL_MS  # current cadence; the timer may run a shorter first lap
+        self.monitor_timer = QTimer(self)
+        self.monitor_timer.timeout.connect(self._poll_resources)
+        self.monitor_timer.start(self._monitor_interval_ms)  # Retuned by _update_monitor_cadence once shown
+
+        self._pending_resource_requests = {}  # worker id -> resource requests left to send
+        self.resource_retry_timer = QTimer(self)
+        self.resource_retry_timer.timeout.connect(self._retry_resource_requests)
+
+        # Bursts of resource reports collapse into a single redraw of resource_display
+        self.resource_refresh_timer = QTimer(self)
+        self.resource_refresh_timer.setSingleShot(True)
+        self.resource_refresh_timer.setInterval(150)
+        self.resource_refresh_timer.timeout.connect(self.update_resource_display)
+
+        self.workers_refresh_timer = QTimer(self)
+        self.workers_refresh_timer.setSingleShot(True)
+        self.workers_refresh_timer.setInterval(150)
+        self.workers_refresh_timer.timeout.connect(self._refresh_worker_views)
+
+        self._pending_errors = []  # (worker id, error) waiting for the next summary dialog
+        self._error_dialog_open = False
+        self.error_popup_timer = QTimer(self)
+        self.error_popup_timer.setSingleShot(True)
+        self.error_popup_timer.setInterval(500)
+        self.error_popup_timer.timeout.connect(self._show_worker_errors)
+
+        self.task_refresh_timer = QTimer(self)
+        self.task_refresh_timer.setSingleShot(True)
+        self.task_refresh_timer.setInterval(50)
+        self.task_refresh_timer.timeout.connect(self._do_task_refresh)
+
+        # Check-box toggles land here; one pass per event-loop spin however many toggled
+        self.combo_update_timer = QTimer(self)
+        self.combo_update_timer.setSingleShot(True)
+        self.combo_update_timer.setInterval(0)
+        self.combo_update_timer.timeout.connect(self._flush_combo_update)
+
+        queued = Qt.QueuedConnection
+        self.resources_updated.connect(self._schedule_resource_refresh, queued)
+        self.workers_changed.connect(self._schedule_workers_refresh, queued)
+        self.task_refresh_requested.connect(self._schedule_task_refresh, queued)
+        self.worker_error_reported.connect(self._queue_worker_error, queued)
 
         self.discovery_timer = QTimer()
         self.discovery_timer.timeout.connect(self.refresh_discovered_workers)
@@ -72,80 +551,6 @@ class MasterUI(QtWidgets.QWidget):
 
         main_layout.addWidget(content_widget, 1)
 
-    def _create_title_bar(self):
-        """Create modern custom title bar with controls"""
-        self.title_bar = QtWidgets.QFrame()
-        self.title_bar.setObjectName("titleBar")
-        self.title_bar.setFixedHeight(50)
-        
-        title_layout = QtWidgets.QHBoxLayout(self.title_bar)
-        title_layout.setContentsMargins(20, 0, 10, 0)
-        title_layout.setSpacing(10)
-
-        app_info_layout = QtWidgets.QHBoxLayout()
-        app_info_layout.setSpacing(12)
-
-        app_icon = QtWidgets.QLabel("🎯")
-        app_icon.setObjectName("appIcon")
-        app_icon.setFont(QtGui.QFont("Segoe UI Emoji", 16))
-        app_info_layout.addWidget(app_icon)
-
-        title_label = QtWidgets.QLabel("WinLink - Master PC (Enhanced)")
-        title_label.setObjectName("titleLabel")
-        title_font = QtGui.QFont("Segoe UI", 11, QtGui.QFont.DemiBold)
-        title_label.setFont(title_font)
-        app_info_layout.addWidget(title_label)
-        
-        title_layout.addLayout(app_info_layout)
-        title_layout.addStretch()
-
-        controls_layout = QtWidgets.QHBoxLayout()
-        controls_layout.setSpacing(0)
-
-        self.minimize_btn = QPushButton("-")
-        self.minimize_btn.setFixedSize(45, 35)
-        self.minimize_btn.clicked.connect(self.showMinimized)
-        self.minimize_btn.setToolTip("Minimize")
-        self.minimize_btn.setStyleSheet("""
-            QPushButton {
-                background: #555555;
-                color: white;
-                font-size: 18px;
-                font-weight: bold;
-                border: 1px solid #777777;
-                border-radius: 4px;
-                padding: 5px;
-                margin-right: 5px;
-            }
-            QPushButton:hover { 
-                background: #666666;
-                border: 1px solid #888888;
-            }
-        """)
-        controls_layout.addWidget(self.minimize_btn)
-
-        self.close_btn = QPushButton("✕")
-        self.close_btn.setFixedSize(45, 35)
-        self.close_btn.clicked.connect(self.close)
-        self.close_btn.setToolTip("Close")
-        self.close_btn.setStyleSheet("""
-            QPushButton {
-                background: #e74c3c;
-                color: white;
-                font-size: 16px;
-                font-weight: bold;
-                border: 1px solid #c0392b;
-                border-radius: 4px;
-            }
-            QPushButton:hover { 
-                background: #c0392b;
-                border: 1px solid #a93226;
-            }
-        """)
-        controls_layout.addWidget(self.close_btn)
-        
-        title_layout.addLayout(controls_layout)
-
     def create_worker_panel(self):
         panel = QtWidgets.QFrame()
         panel.setProperty("glass", True)
@@ -156,10 +561,7 @@ class MasterUI(QtWidgets.QWidget):
         hdr = QtWidgets.QLabel("🖥️ Worker Management", panel)
         hdr.setObjectName("headerLabel")
         hdr.setAlignment(QtCore.Qt.AlignCenter)
-        hf = hdr.font()
-        hf.setPointSize(13)
-        hf.setBold(True)
-        hdr.setFont(hf)
+        hdr.setFont(_HEADER_FONT)
         hdr.setMargin(6)
         lay.addWidget(hdr)
 
@@ -169,11 +571,11 @@ class MasterUI(QtWidgets.QWidget):
         g_l.setContentsMargins(10, 18, 10, 10)
 
         disco_label = QtWidgets.QLabel("🔍 Select Workers:")
-        disco_label.setStyleSheet("font-size: 9pt; font-weight: 600; color: #00f5a0; margin-bottom: 3px;")
+        disco_label.setStyleSheet(_DISCOVERY_LABEL_QSS)
         g_l.addWidget(disco_label)
 
         help_text = QtWidgets.QLabel("Click dropdown to select multiple workers • Auto-refreshes every 2s")
-        help_text.setStyleSheet("font-size: 8pt; color: rgba(255, 255, 255, 0.5); margin-bottom: 5px;")
+        help_text.setStyleSheet(_HELP_TEXT_QSS)
         g_l.addWidget(help_text)
 
         self.discovered_combo = QComboBox()
@@ -183,59 +585,12 @@ class MasterUI(QtWidgets.QWidget):
         self.discovered_combo.setModel(combo_model)
 
         list_view = QtWidgets.QListView()
-        list_view.setStyleSheet("""
-            QListView::item {
-                padding: 8px;
-                border-bottom: 1px solid rgba(255, 255, 255, 0.1);
-            }
-            QListView::item:hover {
-                background: rgba(0, 245, 160, 0.15);
-            }
-        """)
+        list_view.setStyleSheet(_DISCOVERED_LIST_QSS)
         self.discovered_combo.setView(list_view)
 
-        combo_model.dataChanged.connect(self._on_combo_selection_changed)
+        combo_model.itemChanged.connect(self._on_discovered_item_changed)
         
-        self.discovered_combo.setStyleSheet("""
-            QComboBox {
-                background: rgba(15, 20, 30, 0.95);
-                color: #e6e6fa;
-                border: 2px solid rgba(0, 245, 160, 0.25);
-                border-radius: 6px;
-                padding: 6px 10px;
-                font-size: 9pt;
-            }
-            QComboBox:hover {
-                border: 2px solid rgba(0, 245, 160, 0.4);
-            }
-            QComboBox::drop-down {
-                border: none;
-                width: 30px;
-            }
-            QComboBox::down-arrow {
-                image: none;
-                border-left: 5px solid transparent;
-                border-right: 5px solid transparent;
-                border-top: 6px solid #00f5a0;
-                margin-right: 8px;
-            }
-            QComboBox QAbstractItemView {
-                background: rgba(20, 25, 35, 0.98);
-                color: #e6e6fa;
-                selection-background-color: rgba(0, 245, 160, 0.25);
-                border: 2px solid rgba(0, 245, 160, 0.4);
-                border-radius: 6px;
-                padding: 4px;
-            }
-            QComboBox QAbstractItemView::item {
-                padding: 8px 10px;
-                border-radius: 4px;
-                margin: 1px 2px;
-            }
-            QComboBox QAbstractItemView::item:hover {
-                background: rgba(0, 245, 160, 0.15);
-            }
-        """)
+        self.discovered_combo.setStyleSheet(_DISCOVERED_COMBO_QSS)
         
         g_l.addWidget(self.discovered_combo)
 
@@ -243,57 +598,16 @@ class MasterUI(QtWidgets.QWidget):
         connect_btns_layout.setSpacing(6)
         
         self.connect_discovered_btn = QtWidgets.QPushButton("Connect Selected")
-        self.connect_discovered_btn.setObjectName("startBtn")
+        self.connect_discovered_btn.setObjectName("connectSelectedBtn")
         self.connect_discovered_btn.setMinimumHeight(36)
         self.connect_discovered_btn.setEnabled(False)
         self.connect_discovered_btn.clicked.connect(self.connect_from_list)
-        self.connect_discovered_btn.setStyleSheet("""
-            QPushButton {
-                background: rgba(0, 245, 160, 0.7);
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 12px;
-                font-size: 9pt;
-                font-weight: 600;
-            }
-            QPushButton:hover {
-                background: rgba(0, 245, 160, 0.85);
-            }
-            QPushButton:pressed {
-                background: rgba(0, 245, 160, 0.6);
-            }
-            QPushButton:disabled {
-                background: rgba(100, 100, 100, 0.3);
-                color: rgba(255, 255, 255, 0.3);
-            }
-        """)
         
         self.connect_all_btn = QtWidgets.QPushButton("Connect All")
+        self.connect_all_btn.setObjectName("connectAllBtn")
         self.connect_all_btn.setMinimumHeight(36)
         self.connect_all_btn.setEnabled(False)
         self.connect_all_btn.clicked.connect(self.connect_all_discovered)
-        self.connect_all_btn.setStyleSheet("""
-            QPushButton {
-                background: rgba(102, 126, 234, 0.7);
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 12px;
-                font-size: 9pt;
-                font-weight: 600;
-            }
-            QPushButton:hover {
-                background: rgba(102, 126, 234, 0.85);
-            }
-            QPushButton:pressed {
-                background: rgba(102, 126, 234, 0.6);
-            }
-            QPushButton:disabled {
-                background: rgba(100, 100, 100, 0.3);
-                color: rgba(255, 255, 255, 0.3);
-            }
-        """)
         
         connect_btns_layout.addWidget(self.connect_discovered_btn, 1)
         connect_btns_layout.addWidget(self.connect_all_btn, 1)
@@ -301,69 +615,36 @@ class MasterUI(QtWidgets.QWidget):
 
         sep = QtWidgets.QFrame()
         sep.setFrameShape(QtWidgets.QFrame.HLine)
-        sep.setStyleSheet("background: rgba(255, 255, 255, 0.15); margin: 12px 0px 10px 0px; max-height: 1px;")
+        sep.setStyleSheet(_SEPARATOR_QSS)
         g_l.addWidget(sep)
 
         manual_label = QtWidgets.QLabel("✏️ Manual Entry:")
-        manual_label.setStyleSheet("font-size: 9pt; font-weight: 600; color: #667eea; margin-bottom: 5px;")
+        manual_label.setStyleSheet(_MANUAL_LABEL_QSS)
         g_l.addWidget(manual_label)
 
         manual_input_layout = QtWidgets.QHBoxLayout()
         manual_input_layout.setSpacing(6)
         
         self.ip_input = QtWidgets.QLineEdit()
+        self.ip_input.setObjectName("addressInput")
         self.ip_input.setPlaceholderText("IP Address")
         self.ip_input.setMinimumHeight(34)
-        self.ip_input.setStyleSheet("""
-            QLineEdit {
-                background: rgba(25, 30, 40, 0.9);
-                color: #e6e6fa;
-                border: 2px solid rgba(102, 126, 234, 0.25);
-                border-radius: 6px;
-                padding: 6px 10px;
-                font-size: 9pt;
-            }
-            QLineEdit:focus {
-                border: 2px solid rgba(102, 126, 234, 0.5);
-                background: rgba(25, 30, 40, 1);
-            }
-            QLineEdit:hover {
-                border: 2px solid rgba(102, 126, 234, 0.35);
-            }
-        """)
         
         self.port_input = QtWidgets.QLineEdit()
+        self.port_input.setObjectName("addressInput")
         self.port_input.setPlaceholderText("Port")
         self.port_input.setValidator(QtGui.QIntValidator(1, 65535))
         self.port_input.setMinimumHeight(34)
         self.port_input.setFixedWidth(90)
-        self.port_input.setStyleSheet(self.ip_input.styleSheet())
         
         manual_input_layout.addWidget(self.ip_input, 2)
         manual_input_layout.addWidget(self.port_input, 0)
         g_l.addLayout(manual_input_layout)
         
         self.connect_btn = QtWidgets.QPushButton("🔌 Connect")
-        self.connect_btn.setObjectName("startBtn")
+        self.connect_btn.setObjectName("connectBtn")
         self.connect_btn.setMinimumHeight(36)
         self.connect_btn.clicked.connect(self.connect_to_worker)
-        self.connect_btn.setStyleSheet("""
-            QPushButton {
-                background: rgba(102, 126, 234, 0.7);
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 12px;
-                font-size: 9pt;
-                font-weight: 600;
-            }
-            QPushButton:hover {
-                background: rgba(102, 126, 234, 0.85);
-            }
-            QPushButton:pressed {
-                background: rgba(102, 126, 234, 0.6);
-            }
-        """)
         
         g_l.addWidget(self.connect_btn)
         lay.addWidget(grp)
@@ -388,26 +669,15 @@ class MasterUI(QtWidgets.QWidget):
         r_l = QtWidgets.QVBoxLayout(rgrp)
         r_l.setSpacing(6)
         r_l.setContentsMargins(8, 20, 8, 8)
-        self.resource_display = QtWidgets.QTextEdit()
+        self.resource_display = QtWidgets.QPlainTextEdit()
         self.resource_display.setReadOnly(True)
+        self.resource_display.setUndoRedoEnabled(False)  # In-place segment edits must not pile up undo history
         self.resource_display.setMinimumHeight(150)
 
-        font = self.resource_display.font()
-        font.setPointSize(9)  # Comfortable font size
-        font.setFamily("Consolas")  # Monospace font for alignment
-        self.resource_display.setFont(font)
-
-        self.resource_display.setStyleSheet("""
-            QTextEdit {
-                background-color: rgba(30, 30, 40, 0.8);
-                color: #f0f0f0;
-                border: 1px solid rgba(100, 255, 160, 0.5);
-                border-radius: 8px;
-                padding: 10px;
-                font-size: 9pt;
-            }
-        """)
-        self.resource_display.setPlainText("⏳ Waiting for worker resources...\n\nConnect a worker and resources will appear here.")
+        self.resource_display.setFont(_MONO_FONT)  # Monospace font for alignment
+
+        self.resource_display.setStyleSheet(_RESOURCE_DISPLAY_QSS)
+        self._set_resource_text("⏳ Waiting for worker resources...\n\nConnect a worker and resources will appear here.")
         r_l.addWidget(self.resource_display)
 
         refresh_res_btn = QtWidgets.QPushButton("🔄 Refresh Resources")
@@ -427,10 +697,7 @@ class MasterUI(QtWidgets.QWidget):
 
         hdr = QtWidgets.QLabel("📋 Task Management", panel)
         hdr.setObjectName("headerLabel"); hdr.setAlignment(QtCore.Qt.AlignCenter)
-        hf = hdr.font()
-        hf.setPointSize(13)
-        hf.setBold(True)
-        hdr.setFont(hf)
+        hdr.setFont(_HEADER_FONT)
         hdr.setMargin(6)
         lay.addWidget(hdr)
 
@@ -451,52 +718,20 @@ class MasterUI(QtWidgets.QWidget):
         g_l.addWidget(self.template_combo)
         self.task_description = QtWidgets.QLabel(); self.task_description.setWordWrap(True)
 
-        desc_font = self.task_description.font()
-        desc_font.setPointSize(9)
-        desc_font.setBold(True)
-        self.task_description.setFont(desc_font)
-        self.task_description.setStyleSheet("""
-            QLabel {
-                color: #c1d5e0;
-                background-color: rgba(50, 50, 70, 0.5);
-                border-radius: 4px;
-                padding: 6px;
-                margin: 4px 0;
-            }
-        """)
+        self.task_description.setFont(_SMALL_BOLD_FONT)
+        self.task_description.setStyleSheet(_TASK_DESCRIPTION_QSS)
         g_l.addWidget(self.task_description)
-        self.task_code_edit = QtWidgets.QTextEdit(); self.task_code_edit.setMaximumHeight(120)
+        self.task_code_edit = QtWidgets.QPlainTextEdit(); self.task_code_edit.setMaximumHeight(120)
 
-        code_font = self.task_code_edit.font()
-        code_font.setPointSize(9)
-        code_font.setFamily("Consolas")
-        self.task_code_edit.setFont(code_font)
+        self.task_code_edit.setFont(_MONO_FONT)
         g_l.addWidget(self.task_code_edit)
-        self.task_data_edit = QtWidgets.QTextEdit(); self.task_data_edit.setMaximumHeight(80)
+        self.task_data_edit = QtWidgets.QPlainTextEdit(); self.task_data_edit.setMaximumHeight(80)
 
-        data_font = self.task_data_edit.font()
-        data_font.setPointSize(9)
-        data_font.setFamily("Consolas")
-        self.task_data_edit.setFont(data_font)
+        self.task_data_edit.setFont(_MONO_FONT)
         g_l.addWidget(self.task_data_edit)
 
-        editor_style = """
-            QTextEdit {
-                background-color: rgba(30, 30, 40, 0.9);
-                color: #f0f0f0;
-                border: 2px solid rgba(100, 255, 160, 0.3);
-                border-radius: 6px;
-                padding: 8px;
-                font-size: 9pt;
-                font-family: 'Consolas';
-                line-height: 1.3;
-            }
-            QTextEdit:focus {
-                border: 2px solid rgba(100, 255, 160, 0.6);
-            }
-        """
-        self.task_code_edit.setStyleSheet(editor_style)
-        self.task_data_edit.setStyleSheet(editor_style)
+        self.task_code_edit.setStyleSheet(_EDITOR_QSS)
+        self.task_data_edit.setStyleSheet(_EDITOR_QSS)
         
         self.submit_task_btn = QtWidgets.QPushButton("Submit Task"); self.submit_task_btn.setObjectName("startBtn")
         self.submit_task_btn.clicked.connect(self.submit_task)
@@ -510,8 +745,9 @@ class MasterUI(QtWidgets.QWidget):
         t_l.setSpacing(8)
         t_l.setContentsMargins(10, 18, 10, 10)
 
-        self.tasks_table = QtWidgets.QTableWidget(0, 7)
-        self.tasks_table.setHorizontalHeaderLabels(["ID", "Type", "Status", "Worker", "Progress", "Result", "Output"])
+        self.task_model = TaskTableModel(self)
+        self.tasks_table = QtWidgets.QTableView()
+        self.tasks_table.setModel(self.task_model)
 
         self.tasks_table.setColumnWidth(0, 80)   # ID
         self.tasks_table.setColumnWidth(1, 100)  # Type
@@ -519,6 +755,7 @@ class MasterUI(QtWidgets.QWidget):
         self.tasks_table.setColumnWidth(3, 130)  # Worker
         self.tasks_table.setColumnWidth(4, 100)  # Progress
         self.tasks_table.setColumnWidth(5, 150)  # Result
+        self.tasks_table.setItemDelegateForColumn(4, ProgressDelegate(self.tasks_table))
 
         self.tasks_table.setAlternatingRowColors(True)
         self.tasks_table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
@@ -534,48 +771,13 @@ class MasterUI(QtWidgets.QWidget):
         header.setSectionResizeMode(QHeaderView.Interactive)
         header.setSectionResizeMode(6, QHeaderView.Stretch)  # Output stretches
         header.setStretchLastSection(True)
-        hf = header.font()
-        hf.setBold(True)
-        hf.setPointSize(9)
-        header.setFont(hf)
+        header.setFont(_SMALL_BOLD_FONT)
         header.setMinimumHeight(32)
 
         self.tasks_table.verticalHeader().setVisible(False)
         self.tasks_table.verticalHeader().setDefaultSectionSize(40)
 
-        self.tasks_table.setStyleSheet("""
-            QTableWidget {
-                background: rgba(15, 20, 30, 0.95);
-                color: #e6e6fa;
-                border: 2px solid rgba(100, 255, 160, 0.25);
-                border-radius: 6px;
-                gridline-color: rgba(255, 255, 255, 0.08);
-                font-size: 9pt;
-            }
-            QTableWidget::item {
-                padding: 6px;
-                border: none;
-            }
-            QTableWidget::item:selected {
-                background: rgba(0, 245, 160, 0.2);
-                color: white;
-            }
-            QTableWidget::item:hover {
-                background: rgba(0, 245, 160, 0.1);
-            }
-            QHeaderView::section {
-                background: rgba(30, 35, 45, 0.95);
-                color: #00f5a0;
-                padding: 8px;
-                border: none;
-                border-bottom: 2px solid rgba(0, 245, 160, 0.3);
-                font-weight: bold;
-                font-size: 9pt;
-            }
-            QHeaderView::section:hover {
-                background: rgba(40, 45, 55, 0.95);
-            }
-        """)
+        self.tasks_table.setStyleSheet(_TASKS_TABLE_QSS)
         
         t_l.addWidget(self.tasks_table)
 
@@ -583,49 +785,16 @@ class MasterUI(QtWidgets.QWidget):
         btn_layout.setSpacing(8)
 
         refresh_btn = QtWidgets.QPushButton("🔄 Refresh")
+        refresh_btn.setObjectName("refreshTasksBtn")
         refresh_btn.setMinimumHeight(34)
         refresh_btn.setFixedWidth(110)
         refresh_btn.clicked.connect(self.refresh_task_table_async)
-        refresh_btn.setStyleSheet("""
-            QPushButton {
-                background: rgba(102, 126, 234, 0.7);
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 6px 12px;
-                font-size: 9pt;
-                font-weight: 600;
-            }
-            QPushButton:hover {
-                background: rgba(102, 126, 234, 0.85);
-            }
-            QPushButton:pressed {
-                background: rgba(102, 126, 234, 0.6);
-            }
-        """)
 
         clear_btn = QtWidgets.QPushButton("🗑️ Clear Completed")
-        clear_btn.setObjectName("stopBtn")
+        clear_btn.setObjectName("clearTasksBtn")
         clear_btn.setMinimumHeight(34)
         clear_btn.setFixedWidth(150)
         clear_btn.clicked.connect(self.clear_completed_tasks)
-        clear_btn.setStyleSheet("""
-            QPushButton {
-                background: rgba(255, 100, 100, 0.7);
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 6px 12px;
-                font-size: 9pt;
-                font-weight: 600;
-            }
-            QPushButton:hover {
-                background: rgba(255, 120, 120, 0.85);
-            }
-            QPushButton:pressed {
-                background: rgba(255, 100, 100, 0.6);
-            }
-        """)
         
         btn_layout.addWidget(refresh_btn)
         btn_layout.addWidget(clear_btn)
@@ -636,195 +805,157 @@ class MasterUI(QtWidgets.QWidget):
 
         return panel
 
-    def start_monitoring_thread(self):
-        def monitor():
-            while self.monitoring_active:
-                workers = self.network.get_connected_workers()
-                if workers:
-                    for worker_id in workers.keys():
-                        self.network.request_resources_from_worker(worker_id)
-                time.sleep(10)
-        threading.Thread(target=monitor, daemon=True).start()
+    def _poll_resources(self):
+        """Periodic resource request to all connected workers"""
+        self._last_resource_poll = time.monotonic()
+        if self.monitor_timer.interval() != self._monitor_interval_ms:
+            self.monitor_timer.start(self._monitor_interval_ms)  # Shortened catch-up lap done; back to the cadence
+        workers = self.network.get_connected_workers()
+        if workers:
+            self._request_resources_in_background(list(workers.keys()))
 
     def on_worker_selection_changed(self):
         self.disconnect_btn.setEnabled(bool(self.workers_list.selectedItems()))
     
-    def refresh_discovered_workers(self):
-        """Update the dropdown with newly discovered workers"""
+    def refresh_discovered_workers(self, connected_ids: Optional[set] = None):
+        """Update the dropdown with newly discovered workers, touching only rows that changed"""
         discovered = self.network.get_discovered_workers()
-
-        checked_workers = []
-        for i in range(self.discovered_combo.count()):
-            item = self.discovered_combo.model().item(i)
-            if item and item.checkState() == QtCore.Qt.Checked:
-                worker_info_json = item.data(Qt.UserRole)
-                if worker_info_json:
-                    try:
-                        checked_workers.append(json.loads(worker_info_json))
-                    except (json.JSONDecodeError, TypeError):
-                        pass
-
         model = self.discovered_combo.model()
-        model.clear()
-        
+
         if not discovered:
-            item = QtGui.QStandardItem("🔍 Searching for workers...")
-            item.setEnabled(False)
-            model.appendRow(item)
+            if self._discovered_rows or model.rowCount() == 0:
+                self._discovered_rows = {}
+                self._discovered_sigs = {}
+                self._checked_ids.clear()
+                model.clear()
+                item = QtGui.QStandardItem("🔍 Searching for workers...")
+                item.setEnabled(False)
+                model.appendRow(item)
             self.discovered_combo.setEnabled(False)
             self.connect_discovered_btn.setEnabled(False)
             self.connect_all_btn.setEnabled(False)
             return
-        
-        self.discovered_combo.setEnabled(True)
-        selected_count = 0
-        has_unconnected = False
 
+        if connected_ids is None:
+            connected_ids = set(self.network.get_connected_workers())  # One locked copy per tick, not one per worker
+        sigs = {}
         for worker_id, info in discovered.items():
-            hostname = info.get('hostname', 'Unknown')
-            ip = info.get('ip', '')
-            port = info.get('port', '')
+            connected = worker_id in connected_ids
+            sigs[worker_id] = (info.get('hostname', 'Unknown'), info.get('ip', ''), info.get('port', ''), connected)
 
-            connected = worker_id in self.network.get_connected_workers()
-            
-            if connected:
-                display_text = f"✅ {hostname} ({ip}:{port})"
-            else:
-                display_text = f"🖥️ {hostname} ({ip}:{port})"
-                has_unconnected = True
+        if sigs == self._discovered_sigs:
+            return  # Same workers in the same state; the 2 s tick has nothing to do
 
-            item = QtGui.QStandardItem(display_text)
-            item.setFlags(QtCore.Qt.ItemIsUserCheckable | QtCore.Qt.ItemIsEnabled)
-            item.setCheckable(True)
-
-            item.setData(json.dumps(info), Qt.UserRole)
-
-            if info in checked_workers:
-                item.setCheckState(QtCore.Qt.Checked)
-                selected_count += 1
-            else:
-                item.setCheckState(QtCore.Qt.Unchecked)
+        self._refreshing_discovered = True
+        try:
+            if not self._discovered_rows:
+                model.clear()  # Drop the "Searching..." placeholder
+
+            for worker_id in [wid for wid in self._discovered_rows if wid not in sigs]:
+                model.removeRow(self._discovered_rows.pop(worker_id).row())
+                self._checked_ids.discard(worker_id)
+
+            for worker_id, sig in sigs.items():
+                if self._discovered_sigs.get(worker_id) == sig:
+                    continue
+                hostname, ip, port, connected = sig
+                display_text = f"{'✅' if connected else '🖥️'} {hostname} ({ip}:{port})"
+
+                item = self._discovered_rows.get(worker_id)
+                if item is None:
+                    item = QtGui.QStandardItem(display_text)
+                    item.setFlags(QtCore.Qt.ItemIsUserCheckable | QtCore.Qt.ItemIsEnabled)
+                    item.setCheckable(True)
+                    item.setCheckState(QtCore.Qt.Unchecked)
+                    item.setData(worker_id, _WORKER_ID_ROLE)
+                    model.appendRow(item)
+                    self._discovered_rows[worker_id] = item
+                else:
+                    item.setText(display_text)
 
-            if connected:
-                item.setEnabled(False)
-            
-            model.appendRow(item)
+                item.setEnabled(not connected)
+        finally:
+            self._refreshing_discovered = False
+        self._discovered_sigs = sigs
 
+        self.discovered_combo.setEnabled(True)
         self._update_combo_text()
-
         self._update_connect_button_states()
-        self.connect_all_btn.setEnabled(has_unconnected)
-    
+
+    def _on_discovered_item_changed(self, item: QtGui.QStandardItem):
+        """Track which discovered workers are checked as their check boxes change"""
+        worker_id = item.data(_WORKER_ID_ROLE)
+        if worker_id is None:
+            return
+        if item.checkState() == QtCore.Qt.Checked:
+            self._checked_ids.add(worker_id)
+        else:
+            self._checked_ids.discard(worker_id)
+        self._on_combo_selection_changed()
+
     def _on_combo_selection_changed(self):
         """Handle when checkbox states change in the combo box"""
-        print("[MASTER] _on_combo_selection_changed called")
+        if self._refreshing_discovered:
+            return  # refresh_discovered_workers updates the text and buttons once at the end
+        if not self.combo_update_timer.isActive():
+            self.combo_update_timer.start()
+
+    def _flush_combo_update(self):
+        """Apply the check-box changes collected since the last event-loop spin"""
+        logger.debug("Discovered-worker selection changed: %d checked", len(self._checked_ids))
 
         self._update_combo_text()
 
         self._update_connect_button_states()
-    
+
+    def _checked_items(self) -> list:
+        """Checked discovered-worker items, in dropdown order"""
+        items = [self._discovered_rows[wid] for wid in self._checked_ids if wid in self._discovered_rows]
+        items.sort(key=lambda item: item.row())
+        return items
+
     def _update_connect_button_states(self):
         """Update the enabled state of connect buttons based on checked items"""
-        checked_count = 0
-        for i in range(self.discovered_combo.count()):
-            item = self.discovered_combo.model().item(i)
-            if item and item.checkState() == QtCore.Qt.Checked and item.isEnabled():
-                checked_count += 1
-        
-        print(f"[MASTER] _update_connect_button_states: {checked_count} items checked")
+        if self._batch_connect is not None:
+            return  # _finish_batch_connect re-enables them once the running batch reports back
+
+        self.connect_all_btn.setEnabled(not all(sig[3] for sig in self._discovered_sigs.values()))
+        checked_count = sum(1 for wid in self._checked_ids
+                            if wid in self._discovered_sigs and not self._discovered_sigs[wid][3])
+
+        logger.debug("Connect button states: %d unconnected worker(s) checked", checked_count)
 
         self.connect_discovered_btn.setEnabled(checked_count > 0)
-        print(f"[MASTER] Connect button enabled: {checked_count > 0}")
-    
+
     def _update_combo_text(self):
         """Update combo box display text based on selections"""
-        checked_count = 0
-        for i in range(self.discovered_combo.count()):
-            item = self.discovered_combo.model().item(i)
-            if item and item.checkState() == QtCore.Qt.Checked:
-                checked_count += 1
-        
+        checked_count = len(self._checked_ids)
+
         if checked_count == 0:
             self.discovered_combo.setCurrentIndex(0)
         elif checked_count == 1:
-
-            for i in range(self.discovered_combo.count()):
-                item = self.discovered_combo.model().item(i)
-                if item and item.checkState() == QtCore.Qt.Checked:
-                    self.discovered_combo.setCurrentIndex(i)
-                    break
+            for item in self._checked_items():
+                self.discovered_combo.setCurrentIndex(item.row())
         else:
 
             self.discovered_combo.setCurrentText(f"✅ {checked_count} workers selected")
-    
+
     def connect_from_list(self):
         """Connect to selected workers from discovered dropdown"""
-        print("[MASTER] connect_from_list called")
-
-        selected_workers = []
-        model = self.discovered_combo.model()
-        
-        print(f"[MASTER] Combo box has {self.discovered_combo.count()} items")
-        
-        for i in range(self.discovered_combo.count()):
-            item = model.item(i)
-            if item:
-                is_checked = item.checkState() == QtCore.Qt.Checked
-                is_enabled = item.isEnabled()
-                print(f"[MASTER] Item {i}: checked={is_checked}, enabled={is_enabled}, text={item.text()}")
-                
-                if is_checked:
-                    worker_info_json = item.data(Qt.UserRole)
-                    if worker_info_json:
-                        try:
-                            worker_info = json.loads(worker_info_json)
-                            selected_workers.append(worker_info)
-                            print(f"[MASTER] Added worker: {worker_info.get('hostname', 'Unknown')}")
-                        except (json.JSONDecodeError, TypeError) as e:
-                            print(f"[MASTER] Error parsing worker info: {e}")
-        
-        print(f"[MASTER] Total selected workers: {len(selected_workers)}")
+        # Rows carry only their worker id; host details come from the last rendered signatures
+        selected_workers = [self._discovered_sigs[item.data(_WORKER_ID_ROLE)] for item in self._checked_items()]
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Connecting to %d selected worker(s): %s",
+                         len(selected_workers), ", ".join(sig[0] for sig in selected_workers))
         
         if not selected_workers:
             QtWidgets.QMessageBox.warning(self, "No Selection", "Please check at least one worker from the dropdown")
             return
         
-        success_count = 0
-        fail_count = 0
-        already_connected = 0
-        
-        for worker_info in selected_workers:
-            ip = worker_info.get('ip')
-            port = worker_info.get('port')
-            hostname = worker_info.get('hostname', 'Unknown')
-            worker_id = f"{ip}:{port}"
-
-            if worker_id in self.network.get_connected_workers():
-                already_connected += 1
-                continue
-            
-            connected = self.network.connect_to_worker(worker_id, ip, int(port))
-            if connected:
-                success_count += 1
+        targets = [(f"{ip}:{port}", ip, port) for _, ip, port, _ in selected_workers]
 
-                QtCore.QTimer.singleShot(300, lambda wid=worker_id: self.network.request_resources_from_worker(wid))
-            else:
-                fail_count += 1
+        self._start_batch_connect(targets, "Connection Results")
 
-        msg_parts = []
-        if success_count > 0:
-            msg_parts.append(f"✅ Connected: {success_count}")
-        if already_connected > 0:
-            msg_parts.append(f"ℹ️ Already connected: {already_connected}")
-        if fail_count > 0:
-            msg_parts.append(f"❌ Failed: {fail_count}")
-        
-        if msg_parts:
-            QtWidgets.QMessageBox.information(self, "Connection Results", "\n".join(msg_parts))
-        
-        self.refresh_workers_async()
-        self.refresh_discovered_workers()
-    
     def connect_all_discovered(self):
         """Connect to all discovered workers"""
         discovered = self.network.get_discovered_workers()
@@ -833,40 +964,80 @@ class MasterUI(QtWidgets.QWidget):
             QtWidgets.QMessageBox.warning(self, "No Workers", "No workers discovered yet")
             return
         
-        success_count = 0
-        fail_count = 0
-        already_connected = 0
-        
-        for worker_id, info in discovered.items():
+        targets = [(worker_id, info.get('ip'), info.get('port')) for worker_id, info in discovered.items()]
+        self._start_batch_connect(targets, "Bulk Connection Results")
+
+    def _start_batch_connect(self, targets: list, title: str):
+        """Connect to several (worker_id, ip, port) targets in parallel and report once they all finish"""
+        if self._batch_connect is not None:
+            QtWidgets.QMessageBox.information(self, "Connecting", "A connection batch is already in progress")
+            return
 
-            if worker_id in self.network.get_connected_workers():
-                already_connected += 1
+        connected_workers = self.network.get_connected_workers()
+        pending = []
+        invalid = 0
+        already = 0
+        for worker_id, ip, port in targets:
+            if worker_id in connected_workers:
+                already += 1
                 continue
-            
-            ip = info.get('ip')
-            port = info.get('port')
-            
-            connected = self.network.connect_to_worker(worker_id, ip, int(port))
-            if connected:
-                success_count += 1
+            # Convert before entering batch mode: a bad port from discovery must not strand the batch
+            try:
+                port = int(port)
+            except (TypeError, ValueError):
+                print(f"[MASTER] ❌ Skipping {worker_id}: invalid port {port!r}")
+                invalid += 1
+                continue
+            pending.append((worker_id, ip, port))
+
+        self._batch_connect = {
+            'title': title,
+            'pending': {worker_id for worker_id, _, _ in pending},
+            'success': 0,
+            'fail': invalid,
+            'already': already,
+        }
+        if not pending:
+            self._finish_batch_connect()
+            return
 
-                QtCore.QTimer.singleShot(300, lambda wid=worker_id: self.network.request_resources_from_worker(wid))
-            else:
-                fail_count += 1
+        self.connect_discovered_btn.setEnabled(False)
+        self.connect_all_btn.setEnabled(False)
+        for worker_id, ip, port in pending:
+            self.connect_pool.start(
+                ConnectRunnable(self.network, self.batch_connect_signals, worker_id, ip, port)
+            )
+
+    def _on_batch_connect_finished(self, worker_id: str, connected: bool):
+        batch = self._batch_connect
+        if batch is None or worker_id not in batch['pending']:
+            return
+        batch['pending'].discard(worker_id)
+        if connected:
+            batch['success'] += 1
+            self._schedule_resource_requests(worker_id, 1)
+        else:
+            batch['fail'] += 1
+
+        if not batch['pending']:
+            self._finish_batch_connect()
+
+    def _finish_batch_connect(self):
+        batch, self._batch_connect = self._batch_connect, None
+        self._update_connect_button_states()
 
         msg_parts = []
-        if success_count > 0:
-            msg_parts.append(f"✅ Connected: {success_count}")
-        if already_connected > 0:
-            msg_parts.append(f"ℹ️ Already connected: {already_connected}")
-        if fail_count > 0:
-            msg_parts.append(f"❌ Failed: {fail_count}")
-        
-        if msg_parts:
-            QtWidgets.QMessageBox.information(self, "Bulk Connection Results", "\n".join(msg_parts))
-        
+        if batch['success'] > 0:
+            msg_parts.append(f"✅ Connected: {batch['success']}")
+        if batch['already'] > 0:
+            msg_parts.append(f"ℹ️ Already connected: {batch['already']}")
+        if batch['fail'] > 0:
+            msg_parts.append(f"❌ Failed: {batch['fail']}")
+
         self.refresh_workers_async()
-        self.refresh_discovered_workers()
+
+        if msg_parts:
+            QtWidgets.QMessageBox.information(self, batch['title'], "\n".join(msg_parts))
 
     def connect_to_worker(self):
         """Connect to worker using manual IP and port entry"""
@@ -882,10 +1053,21 @@ class MasterUI(QtWidgets.QWidget):
                 f"Already connected to {worker_id}")
             return
 
-        self.resource_display.setPlainText(f"🔄 Connecting to {worker_id}...\n\nRetrying up to 3 times if needed...")
-        QtWidgets.QApplication.processEvents()
-        
-        connected = self.network.connect_to_worker(worker_id, ip, int(port))
+        if worker_id in self._connecting:
+            return
+
+        self._set_resource_text(f"🔄 Connecting to {worker_id}...\n\nRetrying up to 3 times if needed...")
+        self._connecting.add(worker_id)
+        self.connect_btn.setEnabled(False)
+        self.connect_pool.start(
+            ConnectRunnable(self.network, self.connect_signals, worker_id, ip, int(port))
+        )
+
+    def _on_worker_connect_finished(self, worker_id: str, connected: bool):
+        """Report the outcome of a background connect_to_worker attempt"""
+        self._connecting.discard(worker_id)
+        self.connect_btn.setEnabled(not self._connecting)
+
         if not connected:
             error_msg = (
                 f"Failed to connect to {worker_id} after 3 attempts\n\n"
@@ -896,22 +1078,54 @@ class MasterUI(QtWidgets.QWidget):
                 "4. Try waiting 10 more seconds and retry\n\n"
                 "Check console output for detailed error messages."
             )
+            self._set_resource_text("❌ Connection failed. See error message.")
             QtWidgets.QMessageBox.critical(self, "Connection Failed", error_msg)
-            self.resource_display.setPlainText("❌ Connection failed. See error message.")
         else:
+            self._set_resource_text(f"✅ Connected to {worker_id}\n\n⏳ Waiting for resource data...")
+            self._schedule_resource_requests(worker_id, 3)
             QtWidgets.QMessageBox.information(self, "Connected", f"✅ Connected to {worker_id}")
-
-            self.resource_display.setPlainText(f"✅ Connected to {worker_id}\n\n⏳ Waiting for resource data...")
-            QtCore.QTimer.singleShot(300, lambda: self.network.request_resources_from_worker(worker_id))
-            QtCore.QTimer.singleShot(1000, lambda: self.network.request_resources_from_worker(worker_id))
-            QtCore.QTimer.singleShot(2000, lambda: self.network.request_resources_from_worker(worker_id))
         self.refresh_workers_async()
 
+    def _schedule_resource_requests(self, worker_id: str, attempts: int):
+        """Queue resource requests for a freshly connected worker on the shared retry timer"""
+        self._pending_resource_requests[worker_id] = attempts
+        if not self.resource_retry_timer.isActive():
+            self.resource_retry_timer.start(500)
+
+    def _retry_resource_requests(self):
+        """Re-request resources from freshly connected workers until their first report arrives"""
+        due = []
+        for worker_id, remaining in list(self._pending_resource_requests.items()):
+            if worker_id in self.worker_resources or remaining <= 0:
+                del self._pending_resource_requests[worker_id]
+                continue
+            due.append(worker_id)
+            self._pending_resource_requests[worker_id] = remaining - 1
+
+        if due:
+            self._request_resources_in_background(due)
+        if not self._pending_resource_requests:
+            self.resource_retry_timer.stop()
+
     def refresh_workers(self):
+        self._fill_workers_list(self.network.get_connected_workers())
+
+    def _refresh_worker_views(self):
+        """Bring the connected-workers list and the discovered dropdown up to date from one snapshot"""
+        connected = self.network.get_connected_workers()
+        self._fill_workers_list(connected)
+        self.refresh_discovered_workers(set(connected))
+
+    def _fill_workers_list(self, connected: dict):
+        entries = [(wid, f"{info['ip']}:{info['port']}") for wid, info in connected.items()]
+        if entries == self._worker_entries:
+            return  # Rebuilding an unchanged list would only drop the user's selection
+        self._worker_entries = entries
         self.workers_list.clear()
-        for worker_id, info in self.network.get_connected_workers().items():
-            entry = f"{info['ip']}:{info['port']}"
-            self.workers_list.addItem(entry)
+        for worker_id, text in entries:
+            item = QtWidgets.QListWidgetItem(text)
+            item.setData(_WORKER_ID_ROLE, worker_id)
+            self.workers_list.addItem(item)
 
     def disconnect_selected_worker(self):
         sel = self.workers_list.currentItem()
@@ -920,14 +1134,9 @@ class MasterUI(QtWidgets.QWidget):
             return
 
         ip_port = sel.text()
+        worker_id = sel.data(_WORKER_ID_ROLE)
 
-        worker_id = None
-        for wid, info in self.network.get_connected_workers().items():
-            if f"{info['ip']}:{info['port']}" == ip_port:
-                worker_id = wid
-                break
-        
-        if not worker_id:
+        if worker_id not in self.network.get_connected_workers():
             QtWidgets.QMessageBox.warning(self, "Worker Not Found", 
                 f"Could not find worker {ip_port}")
             return
@@ -946,10 +1155,12 @@ class MasterUI(QtWidgets.QWidget):
             print(f"[MASTER] 🔌 Disconnected from worker: {ip_port}")
 
             with self.worker_resources_lock:
-                self.worker_resources.pop(worker_id, None)
+                resources = dict(self.worker_resources)
+                resources.pop(worker_id, None)
+                self.worker_resources = MappingProxyType(resources)
+                self._worker_scores.pop(worker_id, None)
 
             self.refresh_workers_async()
-            self.refresh_discovered_workers()
             self.update_resource_display()
 
             QtWidgets.QMessageBox.information(self, "Disconnected", 
@@ -965,16 +1176,15 @@ class MasterUI(QtWidgets.QWidget):
         except KeyError:
             return
 
-        self.template_combo.clear()
-        for template_key, template_data in TASK_TEMPLATES.items():
-            if template_data.get("type") == selected_type:
-                self.template_combo.addItem(template_key)
-
-        if self.template_combo.count() == 0:
-            self.template_combo.addItem("Custom")
+        # Repopulate silently; clear()/addItems() would otherwise reload the editors on every step
+        self.template_combo.blockSignals(True)
+        try:
+            self.template_combo.clear()
+            self.template_combo.addItems(TEMPLATES_BY_TYPE.get(selected_type) or ["Custom"])
+        finally:
+            self.template_combo.blockSignals(False)
 
-        if self.template_combo.count() > 0:
-            self.on_template_changed(self.template_combo.currentText())
+        self.on_template_changed(self.template_combo.currentText())
     
     def on_template_changed(self, name):
         if not name or name == "Custom":
@@ -983,15 +1193,10 @@ class MasterUI(QtWidgets.QWidget):
             self.task_data_edit.setPlainText("{}")
             return
             
-        desc = TASK_TEMPLATES.get(name, {}).get("description", "")
-        code = TASK_TEMPLATES.get(name, {}).get("code", "")
-        sample_data = TASK_TEMPLATES.get(name, {}).get("sample_data")
-        self.task_description.setText(desc)
-        self.task_code_edit.setPlainText(code)
-        if sample_data is not None:
-            self.task_data_edit.setPlainText(json.dumps(sample_data, indent=2))
-        else:
-            self.task_data_edit.setPlainText("{}")
+        template = TASK_TEMPLATES.get(name, {})
+        self.task_description.setText(template.get("description", ""))
+        self.task_code_edit.setPlainText(template.get("code", ""))
+        self.task_data_edit.setPlainText(_template_data_text(name))
 
     def submit_task(self):
         code = self.task_code_edit.toPlainText()
@@ -1021,18 +1226,17 @@ class MasterUI(QtWidgets.QWidget):
         print(f"[MASTER] 🔄 Available workers: {len(connected_workers)}")
         print(f"[MASTER] ⚠️  MASTER WILL NOT EXECUTE - Only dispatching to worker")
         
-        assigned_worker = self.dispatch_task_to_worker(task_id, code, data)
-        if not assigned_worker:
+        if not self.dispatch_task_to_worker(task_id, code, data):
             QtWidgets.QMessageBox.critical(self, "Dispatch Failed", "Failed to dispatch task to any worker.")
             print(f"[MASTER] ❌ Task {task_id[:8]}... dispatch failed - no available workers")
-        else:
-            worker_short = assigned_worker[:20] + "..." if len(assigned_worker) > 20 else assigned_worker
-            print(f"[MASTER] ✅ Task {task_id[:8]}... dispatched to worker {worker_short}")
-            print(f"[MASTER] ⏳ Waiting for worker '{worker_short}' to execute and return results...")
         self.refresh_task_table_async()
 
     def dispatch_task_to_worker(self, task_id: str, code: str, data: dict) -> Optional[str]:
-        """Dispatch task to best available worker. Returns worker_id if successful, None otherwise."""
+        """Start sending a task to the best available worker in the background.
+
+        Returns the chosen worker_id, or None if there is no worker to send to; the outcome
+        of the send is reported to _on_task_dispatched.
+        """
         workers = self.network.get_connected_workers()
         if not workers:
             return None
@@ -1044,58 +1248,67 @@ class MasterUI(QtWidgets.QWidget):
         task = self.task_manager.get_task(task_id)
         task_name = task.type.name if task else "Unknown Task"
         
-        payload = {
-            'task_id': task_id,
-            'code': code,
-            'data': data,
-            'name': task_name  # Include task type name for better logging
-        }
-        sent = self.network.send_task_to_worker(target_worker, payload)
+        payload = TaskPayload(task_id, code, data, task_name)  # Name included for better logging
+        # Count the task against the worker now, so a burst of submits sees it in the load penalty
+        # while it is still being sent; _on_task_dispatched undoes this if the send fails
+        self.task_manager.assign_task_to_worker(task_id, target_worker)
+        # Large payloads or a stalled worker socket must not freeze the UI while the task is sent
+        QThreadPool.globalInstance().start(
+            DispatchRunnable(self.network, self.dispatch_signals, task_id, target_worker, payload)
+        )
+        return target_worker
+
+    def _on_task_dispatched(self, task_id: str, worker_id: str, sent: bool):
+        if not self.network.running:
+            return  # Window already closed
+
+        worker_short = worker_id[:20] + "..." if len(worker_id) > 20 else worker_id
         if sent:
-            self.task_manager.assign_task_to_worker(task_id, target_worker)
-            return target_worker
-        return None
+            print(f"[MASTER] ✅ Task {task_id[:8]}... dispatched to worker {worker_short}")
+            print(f"[MASTER] ⏳ Waiting for worker '{worker_short}' to execute and return results...")
+        else:
+            self.task_manager.unassign_task(task_id, worker_id)
+            QtWidgets.QMessageBox.critical(self, "Dispatch Failed", f"Failed to send the task to worker {worker_short}.")
+            print(f"[MASTER] ❌ Task {task_id[:8]}... dispatch to {worker_short} failed")
+        self.refresh_task_table_async()
 
     def _select_worker(self, workers: dict) -> str:
         """Intelligently select the best worker based on available resources and load"""
-        resources = self._get_worker_resources_snapshot()
+        scores = self._worker_scores
         
-        if not resources:
+        if not scores:
 
             return list(workers.keys())[0] if workers else None
         
-        best_worker = None
-        best_score = -1
-        
         print(f"[MASTER] 🎯 Load Balancing - Evaluating {len(workers)} workers")
-        
-        for worker_id in workers.keys():
-            stats = resources.get(worker_id, {})
-
-            cpu_available = 100 - stats.get('cpu_percent', 100)  # Available CPU %
-            mem_available = stats.get('memory_available_mb', 0) or 0  # Available memory MB
-            disk_free = stats.get('disk_free_gb', 0) or 0  # Free disk GB
-
-            active_tasks = 0
-            for task_id, task in self.task_manager.tasks.items():
-                if task.worker_id == worker_id and task.status.value in ['pending', 'running']:
-                    active_tasks += 1
-
-            cpu_score = cpu_available * 0.3
-            mem_score = min(mem_available / 1024, 100) * 0.4  # Normalize to 0-100 scale
-            task_score = max(0, 100 - (active_tasks * 20)) * 0.2  # Penalty for each task
-            disk_score = min(disk_free * 10, 100) * 0.1  # Normalize to 0-100 scale
-            
-            total_score = cpu_score + mem_score + task_score + disk_score
-            
-            print(f"[MASTER]   Worker {worker_id[:15]}... Score: {total_score:.1f} "
-                  f"(CPU: {cpu_available:.0f}%, Mem: {mem_available:.0f}MB, "
-                  f"Tasks: {active_tasks}, Disk: {disk_free:.1f}GB)")
-            
-            if total_score > best_score:
-                best_score = total_score
-                best_worker = worker_id
-        
+
+        active_counts = self.task_manager.get_active_task_counts()
+
+        def total_score(worker_id):
+            task_score = max(0, 100 - (active_counts.get(worker_id, 0) * 20)) * 0.2  # Penalty for each task
+            return scores.get(worker_id, _NO_RESOURCES_SCORE)[0] + task_score
+
+        if logger.isEnabledFor(logging.DEBUG):
+            for worker_id in workers:
+                _, cpu_available, mem_available, disk_free = scores.get(worker_id, _NO_RESOURCES_SCORE)
+                logger.debug("Worker %s score %.1f (CPU: %.0f%%, Mem: %.0fMB, Tasks: %d, Disk: %.1fGB)",
+                             worker_id, total_score(worker_id), cpu_available, mem_available,
+                             active_counts.get(worker_id, 0), disk_free)
+
+        if len(workers) >= self.P2C_MIN_WORKERS:
+            # Power of two choices: near-optimal spread without scoring the whole pool
+            best_worker = max(random.sample(list(workers), 2), key=total_score)
+        elif self.FAIR_DISPATCH and len(workers) > 1:
+            ranked = sorted(workers, key=total_score, reverse=True)
+            # |N(0, sigma)| floored to a rank, sigma = min(n/4, 1). From 4 workers up the top one gets ~68% of
+            # picks, the runner-up ~27%, third ~4% and the rest <0.5%; with fewer the top share is higher.
+            # The cap keeps the best worker the most likely pick however large the pool grows.
+            sigma = min(len(ranked) / 4, 1.0)
+            best_worker = ranked[min(int(abs(random.gauss(0, sigma))), len(ranked) - 1)]
+        else:
+            best_worker = max(workers, key=total_score, default=None)  # First of equal scores wins
+        best_score = total_score(best_worker) if best_worker else 0.0
+
         if best_worker:
             print(f"[MASTER] ✅ Selected worker: {best_worker[:15]}... (score: {best_score:.1f})")
         else:
@@ -1106,118 +1319,88 @@ class MasterUI(QtWidgets.QWidget):
         return best_worker
 
     def refresh_task_table(self):
-        tasks = sorted(self.task_manager.get_all_tasks(), key=lambda t: t.created_at, reverse=True)
-        self.tasks_table.setRowCount(len(tasks))
-        for row, t in enumerate(tasks):
+        """Bring the task table in line with the task manager, touching only rows that changed"""
+        version = self.task_manager.version  # Read first: a change racing the render bumps it again
+        if version == self._rendered_task_version:
+            return
+        self._rendered_task_version = version
+
+        with self._batch_table_update(self.tasks_table):
+            changed = self.task_model.set_tasks(self.task_manager.get_sorted_tasks())
+
+            for row in changed:
+                lines = self.task_model.task_at(row).get_output_line_count()
+                estimated = max(40, min(300, lines * 18))
+                if self.tasks_table.rowHeight(row) != estimated:
+                    self.tasks_table.setRowHeight(row, estimated)
+
+    @staticmethod
+    @contextmanager
+    def _batch_table_update(table: QtWidgets.QAbstractItemView):
+        """Hold off repaints while a batch of rows changes so the table paints once at the end"""
+        table.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            table.setUpdatesEnabled(True)
+
+    def refresh_task_table_async(self):
+        """Schedule a table refresh; bursts of progress updates collapse into one render"""
+        self.task_refresh_requested.emit()
+
+    def _schedule_task_refresh(self):
+        if not self.task_refresh_timer.isActive():
+            self.task_refresh_timer.start()
+
+    def _do_task_refresh(self):
+        if self.isMinimized() or not self.isVisible():
+            # Nobody can see the table; render once when the window comes back
+            self._task_refresh_dirty = True
+            return
+        self.refresh_task_table()
 
-            id_item = QtWidgets.QTableWidgetItem(t.id[:8])
-            self.tasks_table.setItem(row, 0, id_item)
+    def _flush_deferred_refreshes(self):
+        if self._task_refresh_dirty:
+            self._task_refresh_dirty = False
+            self.refresh_task_table()
+        if self._resource_refresh_dirty:
+            self._resource_refresh_dirty = False
+            self.update_resource_display()
 
-            type_item = QtWidgets.QTableWidgetItem(t.type.name)
-            self.tasks_table.setItem(row, 1, type_item)
+    def _update_monitor_cadence(self):
+        """Poll quickly while the window is focused and slowly otherwise"""
+        if not hasattr(self, 'monitor_timer') or not self.network.running:
+            return  # Not set up yet, or already shut down by closeEvent
 
-            status_item = QtWidgets.QTableWidgetItem(t.status.name)
-            self.tasks_table.setItem(row, 2, status_item)
+        focused = self.isActiveWindow() and self.isVisible() and not self.isMinimized()
+        interval = self.MONITOR_ACTIVE_INTERVAL_MS if focused else self.MONITOR_BACKGROUND_INTERVAL_MS
+        if self.monitor_timer.isActive() and self._monitor_interval_ms == interval:
+            return
+        self._monitor_interval_ms = interval
+        # Count the new interval from the last poll, not from now: restarting the full countdown
+        # could leave an idle connection silent for nearly two intervals, past the socket timeouts
+        elapsed_ms = int((time.monotonic() - self._last_resource_poll) * 1000)
+        if elapsed_ms >= interval:
+            self.monitor_timer.start(interval)
+            self._poll_resources()  # Overdue (e.g. back from the slower cadence with stale data)
+        else:
+            self.monitor_timer.start(interval - elapsed_ms)
 
-            worker_text = ""
-            if t.worker_id:
-                worker_text = t.worker_id.split(":")[0] if ":" in t.worker_id else t.worker_id
-            worker_item = QtWidgets.QTableWidgetItem(worker_text)
-            self.tasks_table.setItem(row, 3, worker_item)
+    def showEvent(self, event: QtGui.QShowEvent):
+        super().showEvent(event)
+        self._flush_deferred_refreshes()
+        self._update_monitor_cadence()
 
-            progress_widget = QtWidgets.QProgressBar()
-            try:
-                prog_val = int(getattr(t, 'progress', 0) or 0)
-            except Exception:
-                prog_val = 0
-            progress_widget.setRange(0, 100)
-            progress_widget.setValue(max(0, min(100, prog_val)))
-            progress_widget.setTextVisible(True)
-            progress_widget.setFormat(f"{progress_widget.value()}%")
-            progress_widget.setAlignment(QtCore.Qt.AlignCenter)
-            self.tasks_table.setCellWidget(row, 4, progress_widget)
-
-            result_text = ""
-            if t.result is not None:
-                if isinstance(t.result, dict):
-
-                    result_parts = []
-                    for key, val in list(t.result.items())[:3]:  # Show first 3 items
-                        if isinstance(val, (int, float)):
-                            result_parts.append(f"{key}: {val}")
-                        elif isinstance(val, str) and len(val) < 30:
-                            result_parts.append(f"{key}: {val}")
-                        else:
-                            result_parts.append(f"{key}: ...")
-                    result_text = ", ".join(result_parts)
-                    if len(t.result) > 3:
-                        result_text += f" (+{len(t.result)-3} more)"
-                elif isinstance(t.result, (list, tuple)):
-                    if len(t.result) <= 3:
-                        result_text = str(t.result)
-                    else:
-                        result_text = str(list(t.result)[:3]) + f" ... (+{len(t.result)-3} more)"
-                else:
-                    result_str = str(t.result)
-                    result_text = result_str[:100] + ("..." if len(result_str) > 100 else "")
-            elif t.error:
-                result_text = f"Error: {t.error[:80]}"
-            else:
-                result_text = "Pending..."
-            result_item = QtWidgets.QTableWidgetItem(result_text)
-            result_item.setToolTip(result_text)  # Show full text on hover
-            self.tasks_table.setItem(row, 5, result_item)
-
-            output_text = ""
-            if hasattr(t, 'output') and t.output:
-                output_text = str(t.output)
-            elif t.error:
-                output_text = f"ERROR:\n{t.error}"
-            elif t.result is not None:
-
-                if isinstance(t.result, dict):
-                    output_lines = []
-                    for key, val in t.result.items():
-                        if isinstance(val, (dict, list)):
-                            output_lines.append(f"{key}: {json.dumps(val, indent=2)}")
-                        else:
-                            output_lines.append(f"{key}: {val}")
-                    output_text = "\n".join(output_lines)
-                elif isinstance(t.result, (list, tuple)):
-                    output_text = json.dumps(list(t.result) if isinstance(t.result, tuple) else t.result, indent=2)
-                else:
-                    output_text = str(t.result)
-            else:
-                output_text = "No output yet"
-            
-            output_item = QtWidgets.QTableWidgetItem(output_text)
-            output_item.setToolTip(output_text)  # Show full text on hover
-
-            output_item.setTextAlignment(QtCore.Qt.AlignLeft | QtCore.Qt.AlignTop)
-            self.tasks_table.setItem(row, 6, output_item)
-
-            status_item = self.tasks_table.item(row, 2)
-            if status_item:
-                st = status_item.text().upper()
-                try:
-                    if st.startswith('COMPLETED') or 'SUCCESS' in st:
-                        color = QtGui.QColor(200, 255, 200)
-                    elif st.startswith('RUNNING') or st.startswith('IN_PROGRESS'):
-                        color = QtGui.QColor(255, 250, 200)
-                    elif st.startswith('FAILED') or 'ERROR' in st or st.startswith('CANCEL'):
-                        color = QtGui.QColor(255, 200, 200)
-                    else:
-                        color = QtGui.QColor(230, 230, 250)
-                    status_item.setBackground(QtGui.QBrush(color))
-                except Exception:
-                    pass
-
-            lines = output_text.count('\n') + 1
-            estimated = max(40, min(300, lines * 18))
-            self.tasks_table.setRowHeight(row, estimated)
+    def hideEvent(self, event: QtGui.QHideEvent):
+        super().hideEvent(event)
+        self._update_monitor_cadence()
 
-    def refresh_task_table_async(self):
-        QtCore.QTimer.singleShot(0, self.refresh_task_table)
+    def changeEvent(self, event: QtCore.QEvent):
+        super().changeEvent(event)
+        if event.type() == QtCore.QEvent.WindowStateChange and not self.isMinimized():
+            self._flush_deferred_refreshes()
+        if event.type() in (QtCore.QEvent.WindowStateChange, QtCore.QEvent.ActivationChange):
+            self._update_monitor_cadence()
 
     def handle_progress_update(self, worker_id, data):
         task_id = data.get("task_id")
@@ -1225,8 +1408,8 @@ class MasterUI(QtWidgets.QWidget):
 
         if progress in [0, 25, 50, 75, 100]:
             print(f"[MASTER] ⏳ Task {task_id[:8] if task_id else 'unknown'}... progress: {progress}%")
-        self.task_manager.update_task_progress(task_id, progress)
-        self.refresh_task_table_async()
+        if self.task_manager.update_task_progress(task_id, progress):
+            self.refresh_task_table_async()
 
     def handle_task_result(self, worker_id, data):
         task_id = data.get("task_id")
@@ -1243,95 +1426,152 @@ class MasterUI(QtWidgets.QWidget):
             print(f"[MASTER] ❌ Task {task_id[:8] if task_id else 'unknown'}... failed: {error[:50]}")
 
         task = self.task_manager.get_task(task_id)
-        if task:
-            output_parts = []
-            if result_payload.get("stdout"):
-                output_parts.append(f"STDOUT:\n{result_payload['stdout']}")
-            if result_payload.get("stderr"):
-                output_parts.append(f"STDERR:\n{result_payload['stderr']}")
-            if result_payload.get("result") is not None:
-                output_parts.append(f"RESULT:\n{json.dumps(result_payload['result'], indent=2) if isinstance(result_payload['result'], dict) else str(result_payload['result'])}")
-            
-            task.output = "\n\n".join(output_parts) if output_parts else None
-        
         self.task_manager.update_task(task_id, worker_id, result_payload)
+        if task:
+            # Build the table's display strings here on the network thread; the first paint then only reads them.
+            # Entries are tagged with the text revision they were built from, so if a later update clears the
+            # cache mid-format this write is discarded rather than outliving the update.
+            task.warm_text_cache()
         self.refresh_task_table_async()
 
     def handle_resource_data(self, worker_id, data):
         """Handle incoming resource data from workers"""
+        # Convert and score before taking the lock; the critical section is just compare-and-publish
+        stored = WorkerStats.from_dict(data)
+        score = _score_resources(data)
         with self.worker_resources_lock:
-            self.worker_resources[worker_id] = data.copy()
+            if self.worker_resources.get(worker_id) == stored:
+                return  # Identical report: keep the published mapping so the display can skip its redraw
+            self.worker_resources = MappingProxyType({**self.worker_resources, worker_id: stored})
+            self._worker_scores[worker_id] = score
+
+        self.resources_updated.emit()
+
+    def _schedule_resource_refresh(self):
+        if not self.resource_refresh_timer.isActive():
+            self.resource_refresh_timer.start()
 
-        QtCore.QTimer.singleShot(0, self.update_resource_display)
-    
     def update_resource_display(self):
         """Update the resource display with current worker data"""
+        if self.isMinimized() or not self.resource_display.isVisible():
+            # Nothing on screen to update; redraw once when the display is shown again
+            self._resource_refresh_dirty = True
+            return
 
         snapshot = self._get_worker_resources_snapshot()
+        # Every change publishes a new mapping, so the same object means nothing to redraw
+        if snapshot is self._rendered_resources and self._resource_segments is not None:
+            return
 
         if not snapshot:
+            self._resource_blocks.clear()
             connected_workers = self.network.get_connected_workers()
             if not connected_workers:
-                self.resource_display.setPlainText(
+                self._set_resource_text(
                     "⏳ Waiting for worker resources...\n\nConnect a worker and resources will appear here."
                 )
             else:
-                self.resource_display.setPlainText(
+                self._set_resource_text(
                     f"✅ Connected to {len(connected_workers)} worker(s)\n\n⏳ Loading resource data..."
                 )
             return
 
         output = []
         output.append(f"📊 LIVE WORKER RESOURCES - {len(snapshot)} Connected")
-        output.append(f"🕐 Updated: {time.strftime('%H:%M:%S')}")
-        output.append("=" * 50)
+        output.append(f"🕐 Updated: {self._clock_text()}")
+        output.append(self._SEP_EQ)
         output.append("")
-        
-        for wid, stats in snapshot.items():
 
-            worker_ip = wid.split(":")[0] if ":" in wid else wid
+        blocks = {}
+        for wid, stats in snapshot.items():
+            cached = self._resource_blocks.get(wid)
+            # Stored reports are replaced, never mutated, so identity means "unchanged"
+            if cached is not None and cached[0] is stats:
+                block = cached[1]
+            else:
+                block = self._format_worker_block(wid, stats)
+            blocks[wid] = (stats, block)
+            output.append(block)
+        self._resource_blocks = blocks
+
+        self._set_resource_segments(output)
+        self._rendered_resources = snapshot
+
+    def _clock_text(self) -> str:
+        """Current time as HH:MM:SS, formatted at most once per second"""
+        now = int(time.time())
+        if now != self._clock_second:
+            self._clock_second = now
+            self._clock_str = time.strftime('%H:%M:%S', time.localtime(now))
+        return self._clock_str
+
+    def _format_worker_block(self, wid, stats) -> str:
+        """Format one worker's section of the resource display (ends with a blank line)"""
+        worker_ip = wid.split(":")[0] if ":" in wid else wid
+
+        cpu = stats.cpu_percent
+        mem_percent = stats.memory_percent
+        disk_percent = stats.disk_percent
+        battery = stats.battery_percent
+        plugged = stats.battery_plugged
+
+        if battery is not None:
+            icon = "🔌" if plugged else "🔋"
+            status_text = "Charging" if plugged else "On Battery"
+            power = f"{icon} Battery:            {battery:5.0f}% ({status_text})"
+        else:
+            power = "⚡ Power:              AC (No Battery)"
+
+        return _WORKER_BLOCK_FMT % (
+            worker_ip, self._SEP_DASH,
+            _load_icon(cpu), cpu,
+            _load_icon(mem_percent), mem_percent,
+            stats.memory_total_gb, stats.memory_used_gb, stats.memory_available_gb,
+            _load_icon(disk_percent), disk_percent, stats.disk_free_gb,
+            power,
+        )
 
-            cpu = stats.get("cpu_percent", 0.0)
-            mem_percent = stats.get("memory_percent", 0.0)
-            mem_total_mb = stats.get("memory_total_mb", 0.0)
-            mem_avail_mb = stats.get("memory_available_mb", 0.0)
-            mem_used_mb = mem_total_mb - mem_avail_mb if mem_total_mb > 0 else 0
-            disk_percent = stats.get("disk_percent", 0.0)
-            disk_free_gb = stats.get("disk_free_gb", 0.0)
-            battery = stats.get("battery_percent")
-            plugged = stats.get("battery_plugged")
+    def _set_resource_text(self, text: str):
+        """Replace the resource display text, skipping the relayout when nothing changed"""
+        self._resource_segments = None
+        if text == self._resource_text:
+            return
+        self._resource_text = text
+        self.resource_display.setPlainText(text)
+
+    def _set_resource_segments(self, segments: list):
+        """Show segments joined by newlines, rewriting only the segments that differ from the last call"""
+        old = self._resource_segments
+        if old is None or len(old) != len(segments):
+            self._set_resource_text("\n".join(segments))
+            self._resource_segments = segments
+            return
 
-            def status(val):
-                return "🟢" if val < 50 else "🟡" if val < 75 else "🔴"
-            
-            output.append(f"🖥️  WORKER: {worker_ip}")
-            output.append("-" * 50)
-
-            output.append(f"{status(cpu)} CPU Usage:          {cpu:5.1f}%")
-
-            mem_total_gb = mem_total_mb / 1024
-            mem_used_gb = mem_used_mb / 1024
-            mem_avail_gb = mem_avail_mb / 1024
-            output.append(f"{status(mem_percent)} Memory Usage:       {mem_percent:5.1f}%")
-            output.append(f"   • Total RAM:        {mem_total_gb:6.2f} GB")
-            output.append(f"   • Used RAM:         {mem_used_gb:6.2f} GB")
-            output.append(f"   💚 UNUTILIZED RAM:  {mem_avail_gb:6.2f} GB ⭐")
-
-            output.append(f"{status(disk_percent)} Disk Usage:         {disk_percent:5.1f}%")
-            output.append(f"   • Free Space:       {disk_free_gb:6.1f} GB")
-
-            if battery is not None:
-                icon = "🔌" if plugged else "🔋"
-                status_text = "Charging" if plugged else "On Battery"
-                output.append(f"{icon} Battery:            {battery:5.0f}% ({status_text})")
-            else:
-                output.append("⚡ Power:              AC (No Battery)")
-            
-            output.append("")
-        
-        final_text = "\n".join(output)
+        changed = [i for i, (before, after) in enumerate(zip(old, segments)) if before != after]
+        if not changed:
+            return
 
-        self.resource_display.setPlainText(final_text)
+        # First document line of each old segment
+        starts = []
+        line = 0
+        for seg in old:
+            starts.append(line)
+            line += seg.count('\n') + 1
+
+        doc = self.resource_display.document()
+        cursor = QtGui.QTextCursor(doc)
+        cursor.beginEditBlock()
+        # Bottom-up, so edits never shift the lines of segments still to be patched
+        for i in reversed(changed):
+            first = doc.findBlockByNumber(starts[i])
+            last = doc.findBlockByNumber(starts[i] + old[i].count('\n'))
+            cursor.setPosition(first.position())
+            cursor.setPosition(last.position() + last.length() - 1, QtGui.QTextCursor.KeepAnchor)
+            cursor.insertText(segments[i])
+        cursor.endEditBlock()
+
+        self._resource_segments = segments
+        self._resource_text = "\n".join(segments)
 
     def handle_worker_ready(self, worker_id, data):
         self.network.request_resources_from_worker(worker_id)
@@ -1347,50 +1587,101 @@ class MasterUI(QtWidgets.QWidget):
                 "error": error
             })
             self.refresh_task_table_async()
-        QtCore.QTimer.singleShot(
-            0,
-            lambda: QtWidgets.QMessageBox.critical(
-                self,
-                "Worker Error",
-                f"Worker {worker_id} reported an error:\n{error}"
-            )
-        )
+        self.worker_error_reported.emit(worker_id, str(error))
+
+    def _queue_worker_error(self, worker_id, error):
+        """Collect worker errors so a burst of failures produces one dialog instead of one each"""
+        self._pending_errors.append((worker_id, error))
+        if not self._error_dialog_open and not self.error_popup_timer.isActive():
+            self.error_popup_timer.start()
+
+    def _show_worker_errors(self):
+        if self._error_dialog_open or not self._pending_errors:
+            return
+        errors, self._pending_errors = self._pending_errors, []
+
+        if len(errors) == 1:
+            worker_id, error = errors[0]
+            message = f"Worker {worker_id} reported an error:\n{error}"
+        else:
+            lines = [f"• {worker_id}: {error}" for worker_id, error in errors[:10]]
+            if len(errors) > 10:
+                lines.append(f"... and {len(errors) - 10} more")
+            message = f"{len(errors)} worker errors reported:\n\n" + "\n".join(lines)
+
+        self._error_dialog_open = True
+        try:
+            QtWidgets.QMessageBox.critical(self, "Worker Error", message)
+        finally:
+            self._error_dialog_open = False
+        # Errors that arrived while the dialog was up get their own summary
+        if self._pending_errors:
+            self.error_popup_timer.start()
 
     def clear_completed_tasks(self):
         self.task_manager.clear_tasks(status=TaskStatus.COMPLETED)
         self.refresh_task_table()
 
     def refresh_workers_async(self):
-        QtCore.QTimer.singleShot(0, self.refresh_workers)
+        """Schedule a refresh of the workers list and dropdown; a burst of connects/readies collapses into one"""
+        self.workers_changed.emit()
+
+    def _schedule_workers_refresh(self):
+        if not self.workers_refresh_timer.isActive():
+            self.workers_refresh_timer.start()
 
     def refresh_all_worker_resources(self):
         """Manually request resources from all connected workers"""
         workers = self.network.get_connected_workers()
         if not workers:
-            self.resource_display.setPlainText("⚠️  No workers connected.\n\nPlease connect a worker first.")
+            self._set_resource_text("⚠️  No workers connected.\n\nPlease connect a worker first.")
             return
 
-        for worker_id in workers.keys():
-            self.network.request_resources_from_worker(worker_id)
+        self._request_resources_in_background(list(workers.keys()))
+
+    def _request_resources_in_background(self, worker_ids: list):
+        """Send resource requests from the thread pool so a stalled socket cannot freeze the UI"""
+        QThreadPool.globalInstance().start(
+            NetworkCallRunnable(self.network.request_resources_all, worker_ids)
+        )
 
     def _get_worker_resources_snapshot(self):
-        with self.worker_resources_lock:
-            print(f"[DEBUG] 📸 Creating snapshot from {len(self.worker_resources)} stored workers")
-            print(f"[DEBUG] 📸 Worker IDs in resources: {list(self.worker_resources.keys())}")
-            snapshot = {wid: data.copy() for wid, data in self.worker_resources.items()}
-            for wid, data in snapshot.items():
-                print(f"[DEBUG]    ✓ Worker {wid}: {len(data)} data fields - CPU: {data.get('cpu_percent', 'N/A')}")
-            return snapshot
+        # The published mapping is never mutated, so it can be handed out as-is
+        snapshot = self.worker_resources
+        if logger.isEnabledFor(logging.DEBUG):
+            for wid, stats in snapshot.items():
+                logger.debug("resource %s cpu=%s mem=%s disk=%s", wid, stats.cpu_percent,
+                             stats.memory_percent, stats.disk_percent)
+        return snapshot
 
     def closeEvent(self, event: QtGui.QCloseEvent):
         """Handle window close event - cleanup resources"""
         try:
-            self.monitoring_active = False
+            if hasattr(self, 'monitor_timer'):
+                self.monitor_timer.stop()
+
+            if hasattr(self, 'resource_retry_timer'):
+                self.resource_retry_timer.stop()
+
+            if hasattr(self, 'resource_refresh_timer'):
+                self.resource_refresh_timer.stop()
+
+            if hasattr(self, 'workers_refresh_timer'):
+                self.workers_refresh_timer.stop()
+
+            if hasattr(self, 'error_popup_timer'):
+                self.error_popup_timer.stop()
+
+            if hasattr(self, 'task_refresh_timer'):
+                self.task_refresh_timer.stop()
+
+            if hasattr(self, 'combo_update_timer'):
+                self.combo_update_timer.stop()
 
             if hasattr(self, 'discovery_timer'):
                 self.discovery_timer.stop()
 
-            time.sleep(0.1)
+            self.connect_pool.clear()  # Drop connects that have not started yet
             self.network.stop()
         except Exception as ex:
             print(f"Error during cleanup: {ex}")